@@ -6,18 +6,33 @@ Handles automated content generation using OpenAI API for text and vision
 
 import os
 import sys
+import asyncio
 import base64
+import collections
+import hashlib
+import json
 import logging
+import random
+import tempfile
 import time
 import argparse
+import importlib.util
+import httpx
 import openai
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Tuple, Union, Iterator, AsyncIterator
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+try:
+    from Automatizare_Completa.rate_limiter import RateLimiter
+except ImportError:  # Running as a standalone script from inside the package dir
+    from rate_limiter import RateLimiter
+
+# Load environment variables, unless a parent process already passed
+# the resolved environment down
+if not os.environ.get("SB_ENV_LOADED"):
+    load_dotenv()
 
 # Setup logging
 logging.basicConfig(
@@ -26,6 +41,93 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Supported image suffixes mapped to their MIME subtype for data URLs.
+# Single lookup replaces the separate extension check + if/elif type chain.
+_MIME = {
+    ".jpg": "jpeg",
+    ".jpeg": "jpeg",
+    ".png": "png",
+    ".gif": "gif",
+    ".bmp": "bmp",
+    ".webp": "webp",
+}
+
+# Fallback texts, built once at import. The {ts} slot takes the timestamp
+# hashtag; _STRIP_TS sanitizes it in a single translate pass instead of
+# three chained .replace calls per lookup.
+_STRIP_TS = str.maketrans("", "", "-: ")
+_FALLBACK_TEMPLATES = {
+    "API error occurred": "🌟 Exciting content coming soon! Stay tuned for more updates. #{ts}",
+    "Rate limit exceeded": "⏰ Taking a quick break! More amazing content will be shared soon. #SocialBoost #{ts}",
+    "Request timed out": "🚀 Great things take time! Stay connected for upcoming posts. #Patience #{ts}",
+    "Generation failed": "✨ Something wonderful is brewing! Check back soon for fresh content. #ComingSoon #{ts}",
+    "Image file not found": "📸 Capturing the perfect moment! New visual content coming soon. #VisualStory #{ts}",
+    "Unsupported image format": "🎨 Creating beautiful visuals! Stay tuned for amazing image content. #VisualContent #{ts}",
+    "Caption generation failed": "📝 Crafting the perfect words! Caption coming soon. #ContentCreation #{ts}",
+}
+_DEFAULT_FALLBACK = "🌟 Amazing content coming soon! Stay tuned! #{ts}"
+
+# How long a successful status probe stays valid before we hit the network again
+_STATUS_TTL = 60.0
+
+class _SemanticCache:
+    """Embedding-similarity cache over recent prompts.
+
+    Catches prompts that differ only in wording ("Write a post about
+    productivity" vs "Create a productivity post") which the exact-match LRU
+    misses, replacing an API round-trip with a local cosine lookup.
+
+    Requires sentence-transformers (optional dependency); when it is not
+    installed the cache silently disables itself and every lookup misses.
+    """
+
+    def __init__(self, capacity: int = 256, threshold: float = 0.92):
+        self.capacity = capacity
+        self.threshold = threshold
+        self._embedder = None
+        self._disabled = False
+        self._embeddings: List[Any] = []
+        self._responses: List[str] = []
+
+    def _encode(self, prompt: str):
+        """Embed a prompt, lazily loading the model on first use."""
+        if self._disabled:
+            return None
+        if self._embedder is None:
+            try:
+                from sentence_transformers import SentenceTransformer  # type: ignore[import-untyped]
+                self._embedder = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+            except Exception as e:
+                logger.debug(f"Semantic cache disabled (sentence-transformers unavailable): {e}")
+                self._disabled = True
+                return None
+        return self._embedder.encode(prompt, normalize_embeddings=True)
+
+    def get(self, prompt: str) -> Optional[str]:
+        """Return the cached response for the most similar prompt, if any."""
+        vector = self._encode(prompt)
+        if vector is None or not self._embeddings:
+            return None
+
+        import numpy as np
+        sims = np.stack(self._embeddings) @ vector
+        best = int(sims.argmax())
+        if sims[best] >= self.threshold:
+            logger.info(f"✓ Semantic cache hit (similarity {sims[best]:.3f})")
+            return self._responses[best]
+        return None
+
+    def put(self, prompt: str, response: str) -> None:
+        """Store a (prompt embedding, response) pair, evicting the oldest."""
+        vector = self._encode(prompt)
+        if vector is None:
+            return
+        self._embeddings.append(vector)
+        self._responses.append(response)
+        if len(self._embeddings) > self.capacity:
+            self._embeddings.pop(0)
+            self._responses.pop(0)
+
 class ContentGenerator:
     """OpenAI-powered content generation system."""
     
@@ -38,16 +140,138 @@ class ContentGenerator:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY in .env file.")
         
         try:
-            self.client = openai.OpenAI(api_key=self.api_key)
+            # Tuned transport: larger keepalive pool than the httpx default
+            # and HTTP/2 multiplexing when the optional h2 package is present,
+            # so concurrent calls share connections instead of queueing
+            limits = httpx.Limits(max_connections=64, max_keepalive_connections=32,
+                                  keepalive_expiry=60.0)
+            timeout = httpx.Timeout(60.0, connect=5.0)
+            http2 = importlib.util.find_spec("h2") is not None
+            self._http_client = httpx.Client(http2=http2, limits=limits, timeout=timeout)
+            self._ahttp_client = httpx.AsyncClient(http2=http2, limits=limits, timeout=timeout)
+            self.client = openai.OpenAI(api_key=self.api_key, http_client=self._http_client)
+            self.aclient = openai.AsyncOpenAI(api_key=self.api_key, http_client=self._ahttp_client)
             logger.info(f"ContentGenerator initialized with model: {self.model}")
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI client: {e}")
             raise
+
+        # Bound concurrent async API calls (network-bound workload); the
+        # semaphore is cached per event loop (see _get_semaphore)
+        self.max_concurrency = int(os.getenv("OPENAI_CONCURRENCY", "8"))
+        self._sem: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+
+        # Client-side throttle so bursts stay under the OpenAI RPM bucket
+        self._rate_limiter = RateLimiter(
+            max_per_minute=int(os.getenv("OPENAI_RPM", "60")),
+            max_concurrency=self.max_concurrency
+        )
+
+        # LRU cache of successful generations keyed by prompt hash, so
+        # identical requests (retries, test suites, variants) skip the API
+        self._cache: "collections.OrderedDict[str, str]" = collections.OrderedDict()
+        self._cache_capacity = int(os.getenv("GEN_CACHE_CAP", "1024"))
+
+        # Cache of base64-encoded images keyed by (path, mtime, size), so
+        # repeated captions of the same file skip the read+encode entirely
+        self._b64_cache: "collections.OrderedDict[tuple, str]" = collections.OrderedDict()
+        self._b64_cache_capacity = 32
+
+        # Similarity cache over recent prompts (no-op when the optional
+        # sentence-transformers dependency is missing)
+        self._semantic_cache: Optional[_SemanticCache] = None
+        if os.getenv("GEN_SEMANTIC_CACHE", "1") == "1":
+            self._semantic_cache = _SemanticCache()
+
+        # Timestamp of the last successful API status probe (see check_api_status)
+        self._last_ok_ts = 0.0
+
+    def close(self) -> None:
+        """Close the underlying HTTP transports.
+
+        The async transport needs an event loop to close cleanly: when one
+        is running its aclose() is scheduled on it, otherwise a throwaway
+        loop drives the shutdown. Prefer aclose() from async code.
+        """
+        try:
+            self._http_client.close()
+        except Exception:
+            pass
+        try:
+            if self._ahttp_client.is_closed:
+                return
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(self._ahttp_client.aclose())
+            else:
+                loop.create_task(self._ahttp_client.aclose())
+        except Exception:
+            pass
+
+    async def aclose(self) -> None:
+        """Async variant of close() for callers already inside a loop."""
+        try:
+            self._http_client.close()
+        except Exception:
+            pass
+        try:
+            await self._ahttp_client.aclose()
+        except Exception:
+            pass
+
+    def __del__(self):
+        # Finalizers run at arbitrary points (cyclic GC, interpreter
+        # shutdown); never start an event loop here — only schedule the
+        # async shutdown when a loop happens to be running.
+        try:
+            self._http_client.close()
+        except Exception:
+            pass
+        try:
+            if not self._ahttp_client.is_closed:
+                asyncio.get_running_loop().create_task(self._ahttp_client.aclose())
+        except Exception:
+            pass
+
+    @staticmethod
+    def _validate_image(image_path: Path) -> Optional[str]:
+        """Return a fallback-text key for an unusable image, or None if valid."""
+        if not image_path.exists() or not image_path.is_file():
+            return "Image file not found"
+        if image_path.suffix.lower() not in _MIME:
+            return "Unsupported image format"
+        return None
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Return a cached generation for the key, refreshing its LRU position."""
+        value = self._cache.get(key)
+        if value is not None:
+            self._cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, key: str, value: str) -> None:
+        """Store a successful generation, evicting the oldest entry when full."""
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_capacity:
+            self._cache.popitem(last=False)
     
     def generate_post_text(self, prompt: str, max_tokens: int = 500) -> str:
         """Generate social media post text using OpenAI."""
-        logger.info(f"Generating post text for prompt: {prompt[:50]}...")
-        
+        logger.info("Generating post text for prompt: %.50s...", prompt)
+
+        cache_key = hashlib.sha256(f"{self.model}|{max_tokens}|{prompt}".encode('utf-8')).hexdigest()
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info("✓ Cache hit for prompt, skipping API call")
+            return cached
+
+        if self._semantic_cache is not None:
+            similar = self._semantic_cache.get(prompt)
+            if similar is not None:
+                return similar
+
         # Retry logic
         max_retries = 3
         for attempt in range(max_retries):
@@ -63,24 +287,30 @@ class ContentGenerator:
                     }
                 ]
                 
-                logger.info(f"Making OpenAI API call with model: {self.model} (attempt {attempt + 1}/{max_retries})")
+                logger.info("Making OpenAI API call with model: %s (attempt %d/%d)", self.model, attempt + 1, max_retries)
+                self._rate_limiter.wait_if_throttled()
                 response = self.client.chat.completions.create(
                     model=self.model,
                     messages=messages,  # type: ignore
                     max_tokens=max_tokens,
                     temperature=0.7
                 )
-                
+                self._rate_limiter.record_success()
+
                 generated_text = response.choices[0].message.content
                 if generated_text is None:
                     logger.warning("Generated text is None, using fallback")
                     return self._get_fallback_text("Text generation failed")
                 
-                logger.info(f"✓ Generated text successfully ({len(generated_text)} characters)")
-                
+                logger.info("✓ Generated text successfully (%d characters)", len(generated_text))
+
+                self._cache_put(cache_key, generated_text)
+                if self._semantic_cache is not None:
+                    self._semantic_cache.put(prompt, generated_text)
                 return generated_text
                 
             except openai.RateLimitError as e:
+                self._rate_limiter.record_failure()
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt  # Exponential backoff
                     logger.warning(f"Rate limit error: {e}. Retrying in {wait_time} seconds...")
@@ -132,42 +362,172 @@ class ContentGenerator:
         # This should never be reached, but just in case
         return self._get_fallback_text("Generation failed")
     
+    def _build_post_messages(self, prompt: str) -> List[Dict[str, Any]]:
+        """Build the chat messages for a post-text generation request."""
+        return [
+            {
+                "role": "system",
+                "content": "You are a social media content creator. Generate engaging, authentic posts for Facebook. Keep posts conversational, engaging, and appropriate for a general audience. Include relevant hashtags when appropriate."
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+
+    def stream_post_text(self, prompt: str, max_tokens: int = 500) -> Iterator[str]:
+        """Stream post text generation, yielding content deltas as they arrive.
+
+        Callers (UI, pipelines) can start consuming output after the first
+        token instead of waiting for the full completion.
+        """
+        logger.info("Streaming post text for prompt: %.50s...", prompt)
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._build_post_messages(prompt),  # type: ignore
+            max_tokens=max_tokens,
+            temperature=0.7,
+            stream=True
+        )
+        for chunk in response:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
+
+    async def astream_post_text(self, prompt: str, max_tokens: int = 500) -> AsyncIterator[str]:
+        """Async variant of stream_post_text."""
+        logger.info("Streaming post text (async) for prompt: %.50s...", prompt)
+        response = await self.aclient.chat.completions.create(
+            model=self.model,
+            messages=self._build_post_messages(prompt),  # type: ignore
+            max_tokens=max_tokens,
+            temperature=0.7,
+            stream=True
+        )
+        async for chunk in response:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
+
+    def _read_b64(self, image_path: Path) -> str:
+        """Read an image file and return its base64 encoding, with caching.
+
+        Encoded data is cached keyed by (path, mtime_ns, size) so repeated
+        captions of an unchanged file reuse the previous encode.
+        """
+        cache_key = None
+        try:
+            st = image_path.stat()
+            cache_key = (str(image_path), st.st_mtime_ns, st.st_size)
+            cached = self._b64_cache.get(cache_key)
+            if cached is not None:
+                self._b64_cache.move_to_end(cache_key)
+                return cached
+        except OSError:
+            pass
+
+        with open(image_path, 'rb') as image_file:
+            image_data = image_file.read()
+        base64_image = base64.b64encode(image_data).decode('utf-8')
+
+        if cache_key is not None:
+            self._b64_cache[cache_key] = base64_image
+            while len(self._b64_cache) > self._b64_cache_capacity:
+                self._b64_cache.popitem(last=False)
+        return base64_image
+
+    async def _aread_b64(self, image_path: Path) -> str:
+        """Async wrapper that moves the blocking read+encode off the event loop."""
+        return await asyncio.to_thread(self._read_b64, image_path)
+
+    async def agenerate_caption_for_image(self, image_path: Path, context_prompt: str = "") -> str:
+        """Async variant of generate_caption_for_image.
+
+        The file read and base64 encode run in a worker thread so large
+        images do not block the event loop while other captions are in flight.
+        """
+        logger.info("Generating caption (async) for image: %s", image_path)
+
+        error = self._validate_image(image_path)
+        if error:
+            logger.error("%s: %s", error, image_path)
+            return self._get_fallback_text(error)
+
+        image_type = _MIME[image_path.suffix.lower()]
+
+        try:
+            base64_image = await self._aread_b64(image_path)
+        except Exception as e:
+            logger.error(f"Failed to read image {image_path}: {e}")
+            return self._get_fallback_text("Caption generation failed")
+
+        messages = [
+            {
+                "role": "system",
+                "content": "You are a social media content creator. Analyze the provided image and generate an engaging caption for Facebook. Make it conversational, relevant to the image content, and include appropriate hashtags. Keep it under 200 characters."
+            },
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Generate a Facebook caption for this image.{' ' + context_prompt if context_prompt else ''}"
+                    },
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": f"data:image/{image_type};base64,{base64_image}"
+                        }
+                    }
+                ]
+            }
+        ]
+
+        try:
+            generated_caption = await self._with_backoff(lambda: self._achat(messages, 300))
+            if generated_caption is None:
+                logger.warning("Generated caption is None, using fallback")
+                return self._get_fallback_text("Caption generation failed")
+            logger.info("✓ Generated caption successfully (%d characters)", len(generated_caption))
+            return generated_caption
+        except Exception as e:
+            logger.error(f"✗ Async caption generation failed: {e}")
+            return self._get_fallback_text("Caption generation failed")
+
     def generate_caption_for_image(self, image_path: Path, context_prompt: str = "") -> str:
         """Generate caption for an image using OpenAI Vision."""
-        logger.info(f"Generating caption for image: {image_path}")
-        
-        # Validate image file
-        if not image_path.exists() or not image_path.is_file():
-            logger.error(f"Image file not found: {image_path}")
-            return self._get_fallback_text("Image file not found")
-        
-        # Check file extension
-        valid_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'}
-        if image_path.suffix.lower() not in valid_extensions:
-            logger.error(f"Unsupported image format: {image_path.suffix}")
-            return self._get_fallback_text("Unsupported image format")
+        logger.info("Generating caption for image: %s", image_path)
         
+        # Validate image file before any network work
+        error = self._validate_image(image_path)
+        if error:
+            logger.error("%s: %s", error, image_path)
+            return self._get_fallback_text(error)
+
+        image_type = _MIME[image_path.suffix.lower()]
+
+        # Read and encode the image once, reused across retries
+        try:
+            base64_image = self._read_b64(image_path)
+        except Exception as e:
+            logger.error(f"Failed to read image {image_path}: {e}")
+            return self._get_fallback_text("Caption generation failed")
+        image_part: Dict[str, Any] = {
+            "type": "image_url",
+            "image_url": {"url": f"data:image/{image_type};base64,{base64_image}"}
+        }
+
+        # Cache key over the image content plus the context prompt
+        cache_key = hashlib.sha256(
+            f"{self.model}|{image_path.suffix.lower()}|{context_prompt}|{base64_image}".encode('utf-8')
+        ).hexdigest()
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info("✓ Cache hit for image caption, skipping API call")
+            return cached
+
         # Retry logic
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                # Read and encode image
-                with open(image_path, 'rb') as image_file:
-                    image_data = image_file.read()
-                    base64_image = base64.b64encode(image_data).decode('utf-8')
-                
-                # Determine image type
-                image_type = "jpeg"
-                if image_path.suffix.lower() in ['.png']:
-                    image_type = "png"
-                elif image_path.suffix.lower() in ['.gif']:
-                    image_type = "gif"
-                elif image_path.suffix.lower() in ['.webp']:
-                    image_type = "webp"
-                
-                # Construct data URL
-                data_url = f"data:image/{image_type};base64,{base64_image}"
-                
                 # Build messages for Vision API
                 messages = [
                     {
@@ -181,34 +541,33 @@ class ContentGenerator:
                                 "type": "text",
                                 "text": f"Generate a Facebook caption for this image.{' ' + context_prompt if context_prompt else ''}"
                             },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": data_url
-                                }
-                            }
+                            image_part
                         ]
                     }
                 ]
                 
-                logger.info(f"Making OpenAI Vision API call with model: {self.model} (attempt {attempt + 1}/{max_retries})")
+                logger.info("Making OpenAI Vision API call with model: %s (attempt %d/%d)", self.model, attempt + 1, max_retries)
+                self._rate_limiter.wait_if_throttled()
                 response = self.client.chat.completions.create(
                     model=self.model,
                     messages=messages,  # type: ignore
                     max_tokens=300,
                     temperature=0.7
                 )
-                
+                self._rate_limiter.record_success()
+
                 generated_caption = response.choices[0].message.content
                 if generated_caption is None:
                     logger.warning("Generated caption is None, using fallback")
                     return self._get_fallback_text("Caption generation failed")
                 
-                logger.info(f"✓ Generated caption successfully ({len(generated_caption)} characters)")
-                
+                logger.info("✓ Generated caption successfully (%d characters)", len(generated_caption))
+
+                self._cache_put(cache_key, generated_caption)
                 return generated_caption
                 
             except openai.RateLimitError as e:
+                self._rate_limiter.record_failure()
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt
                     logger.warning(f"Rate limit error: {e}. Retrying in {wait_time} seconds...")
@@ -260,12 +619,263 @@ class ContentGenerator:
         # This should never be reached, but just in case
         return self._get_fallback_text("Caption generation failed")
     
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get (or lazily create) the semaphore bounding concurrent API calls.
+
+        A semaphore binds to the loop it first blocks on, and each
+        generate_many_sync call runs under a fresh asyncio.run loop, so
+        the cache is keyed on the running loop and rebuilt when it changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._sem[0] is not loop:
+            self._sem = (loop, asyncio.Semaphore(self.max_concurrency))
+        return self._sem[1]
+
+    async def _achat(self, messages: List[Dict[str, Any]], max_tokens: int) -> Optional[str]:
+        """Make a single async chat completion call, bounded by the concurrency semaphore."""
+        async with self._get_semaphore():
+            await asyncio.to_thread(self._rate_limiter.wait_if_throttled)
+            try:
+                response = await self.aclient.chat.completions.create(
+                    model=self.model,
+                    messages=messages,  # type: ignore
+                    max_tokens=max_tokens,
+                    temperature=0.7
+                )
+            except openai.RateLimitError:
+                self._rate_limiter.record_failure()
+                raise
+        self._rate_limiter.record_success()
+        return response.choices[0].message.content
+
+    async def _with_backoff(self, coro_factory, max_tries: int = 3,
+                            base: float = 1.0, cap: float = 16.0):
+        """Retry an async call with exponential backoff and full jitter.
+
+        Uses asyncio.sleep, never time.sleep: a blocking sleep inside a
+        coroutine would stall the event loop and serialize the whole
+        semaphore-bounded batch.
+        """
+        for attempt in range(max_tries):
+            try:
+                return await coro_factory()
+            except (openai.RateLimitError, openai.APIConnectionError, openai.APITimeoutError) as e:
+                if attempt >= max_tries - 1:
+                    raise
+                delay = min(cap, base * 2 ** attempt) * random.random()
+                logger.warning(f"Retryable error: {e}. Retrying in {delay:.2f} seconds...")
+                await asyncio.sleep(delay)
+
+    async def agenerate_post_text(self, prompt: str, max_tokens: int = 500) -> str:
+        """Async variant of generate_post_text for concurrent bulk generation."""
+        logger.info("Generating post text (async) for prompt: %.50s...", prompt)
+
+        messages = self._build_post_messages(prompt)
+
+        try:
+            generated_text = await self._with_backoff(lambda: self._achat(messages, max_tokens))
+            if generated_text is None:
+                logger.warning("Generated text is None, using fallback")
+                return self._get_fallback_text("Text generation failed")
+            logger.info("✓ Generated text successfully (%d characters)", len(generated_text))
+            return generated_text
+        except Exception as e:
+            logger.error(f"✗ Async generation failed: {e}")
+            return self._get_fallback_text("Generation failed")
+
+    async def generate_many(self, prompts: List[str], max_tokens: int = 500) -> List[str]:
+        """Generate posts for multiple prompts concurrently.
+
+        Calls run concurrently via asyncio.gather, bounded by OPENAI_CONCURRENCY
+        (default 8), so N prompts take roughly ceil(N / concurrency) round-trips
+        instead of N sequential ones. Failed prompts fall back to fallback text.
+        """
+        logger.info(f"Generating {len(prompts)} posts concurrently (max {self.max_concurrency} in flight)")
+        results = await asyncio.gather(
+            *(self.agenerate_post_text(p, max_tokens) for p in prompts),
+            return_exceptions=True
+        )
+        texts: List[str] = []
+        for prompt, result in zip(prompts, results):
+            if isinstance(result, BaseException):
+                logger.error(f"✗ Generation failed for prompt '{prompt[:50]}': {result}")
+                texts.append(self._get_fallback_text("Generation failed"))
+            else:
+                texts.append(result)
+        return texts
+
+    def generate_many_sync(self, prompts: List[str], max_tokens: int = 500) -> List[str]:
+        """Synchronous wrapper around generate_many for non-async callers."""
+        return asyncio.run(self.generate_many(prompts, max_tokens))
+
+    def generate_variations(self, base_content: str, count: int = 3) -> List[str]:
+        """Generate N variations of a post with a single structured-output call.
+
+        One request returning a JSON array amortizes the system prompt and
+        the network round-trip over all variations, instead of paying them
+        N times with per-variation calls.
+        """
+        logger.info(f"Generating {count} variations in a single call")
+
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "variations",
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "items": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "minItems": count,
+                            "maxItems": count
+                        }
+                    },
+                    "required": ["items"],
+                    "additionalProperties": False
+                },
+                "strict": True
+            }
+        }
+
+        try:
+            self._rate_limiter.wait_if_throttled()
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": f"You are a social media content creator. Return exactly {count} distinct variations of the user's Facebook post as JSON."
+                    },
+                    {
+                        "role": "user",
+                        "content": f"Base post:\n{base_content}\nN={count}"
+                    }
+                ],  # type: ignore
+                max_tokens=300 * count,
+                temperature=0.9,
+                response_format=response_format  # type: ignore
+            )
+            self._rate_limiter.record_success()
+
+            content = response.choices[0].message.content
+            if content is None:
+                logger.warning("Variations response is None, using fallback")
+                return [self._get_fallback_text("Generation failed")] * count
+
+            items = json.loads(content).get("items", [])
+            if len(items) < count:
+                logger.warning(f"Got {len(items)} variations, expected {count}; padding with fallback")
+                items += [self._get_fallback_text("Generation failed")] * (count - len(items))
+            logger.info(f"✓ Generated {count} variations successfully")
+            return items[:count]
+
+        except Exception as e:
+            logger.error(f"✗ Variation generation failed: {e}")
+            return [self._get_fallback_text("Generation failed")] * count
+
+    def generate_batch(self, prompts: List[str], window: str = "24h", max_tokens: int = 500,
+                       poll_timeout: float = 86400.0) -> Dict[str, str]:
+        """Generate posts for multiple prompts via the OpenAI Batch API.
+
+        Intended for non-interactive jobs (e.g. overnight scheduled posts) where
+        hours of latency are acceptable: batch requests cost half as much per
+        token and draw from a separate quota. Returns a dict keyed by custom_id
+        ("post-0", "post-1", ...); prompts whose sub-request failed fall back to
+        fallback text.
+        """
+        logger.info(f"Submitting batch of {len(prompts)} prompts (completion window: {window})")
+
+        system_message = {
+            "role": "system",
+            "content": "You are a social media content creator. Generate engaging, authentic posts for Facebook. Keep posts conversational, engaging, and appropriate for a general audience. Include relevant hashtags when appropriate."
+        }
+
+        try:
+            # Serialize requests to JSONL and upload via the Files API
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False, encoding='utf-8') as f:
+                batch_file_path = Path(f.name)
+                for i, prompt in enumerate(prompts):
+                    f.write(json.dumps({
+                        "custom_id": f"post-{i}",
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": self.model,
+                            "messages": [system_message, {"role": "user", "content": prompt}],
+                            "max_tokens": max_tokens,
+                            "temperature": 0.7
+                        }
+                    }, ensure_ascii=False) + "\n")
+
+            try:
+                with open(batch_file_path, 'rb') as f:
+                    input_file = self.client.files.create(file=f, purpose="batch")
+            finally:
+                batch_file_path.unlink(missing_ok=True)
+
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window=window
+            )
+            logger.info(f"Batch submitted. Batch ID: {batch.id}")
+
+            # Poll with exponential backoff (1s -> 60s cap) until terminal state
+            deadline = time.monotonic() + poll_timeout
+            wait_time = 1.0
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if time.monotonic() >= deadline:
+                    logger.error(f"✗ Batch {batch.id} did not complete within {poll_timeout} seconds")
+                    return {f"post-{i}": self._get_fallback_text("Request timed out") for i in range(len(prompts))}
+                time.sleep(wait_time)
+                wait_time = min(wait_time * 2, 60.0)
+                batch = self.client.batches.retrieve(batch.id)
+                logger.info(f"Batch {batch.id} status: {batch.status}")
+
+            if batch.status != "completed" or not batch.output_file_id:
+                logger.error(f"✗ Batch {batch.id} finished with status: {batch.status}")
+                return {f"post-{i}": self._get_fallback_text("Generation failed") for i in range(len(prompts))}
+
+            # Download output and demux by custom_id
+            output = self.client.files.content(batch.output_file_id)
+            results: Dict[str, str] = {}
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                custom_id = entry.get("custom_id", "")
+                response = entry.get("response") or {}
+                if response.get("status_code") == 200:
+                    choices = response.get("body", {}).get("choices", [])
+                    content = choices[0]["message"]["content"] if choices else None
+                    results[custom_id] = content if content else self._get_fallback_text("Text generation failed")
+                else:
+                    logger.warning(f"Batch sub-request {custom_id} failed: {entry.get('error')}")
+                    results[custom_id] = self._get_fallback_text("Generation failed")
+
+            # Fill in any sub-requests missing from the output file
+            for i in range(len(prompts)):
+                results.setdefault(f"post-{i}", self._get_fallback_text("Generation failed"))
+
+            logger.info(f"✓ Batch completed: {len(results)} results")
+            return results
+
+        except Exception as e:
+            logger.error(f"✗ Batch generation failed: {e}")
+            return {f"post-{i}": self._get_fallback_text("Generation failed") for i in range(len(prompts))}
+
     def check_api_status(self) -> bool:
-        """Check if OpenAI API is accessible."""
+        """Check if OpenAI API is accessible (cached for _STATUS_TTL seconds)."""
+        now = time.monotonic()
+        if now - self._last_ok_ts < _STATUS_TTL:
+            return True
+
         try:
             logger.info("Checking OpenAI API status...")
             models = self.client.models.list()
             logger.info("✓ OpenAI API is accessible")
+            self._last_ok_ts = now
             return True
         except Exception as e:
             logger.error(f"✗ OpenAI API check failed: {e}")
@@ -273,18 +883,8 @@ class ContentGenerator:
     
     def _get_fallback_text(self, error_type: str) -> str:
         """Generate fallback text when API calls fail."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-        fallback_texts = {
-            "API error occurred": f"🌟 Exciting content coming soon! Stay tuned for more updates. #{timestamp.replace('-', '').replace(' ', '').replace(':', '')}",
-            "Rate limit exceeded": f"⏰ Taking a quick break! More amazing content will be shared soon. #SocialBoost #{timestamp.replace('-', '').replace(' ', '').replace(':', '')}",
-            "Request timed out": f"🚀 Great things take time! Stay connected for upcoming posts. #Patience #{timestamp.replace('-', '').replace(' ', '').replace(':', '')}",
-            "Generation failed": f"✨ Something wonderful is brewing! Check back soon for fresh content. #ComingSoon #{timestamp.replace('-', '').replace(' ', '').replace(':', '')}",
-            "Image file not found": f"📸 Capturing the perfect moment! New visual content coming soon. #VisualStory #{timestamp.replace('-', '').replace(' ', '').replace(':', '')}",
-            "Unsupported image format": f"🎨 Creating beautiful visuals! Stay tuned for amazing image content. #VisualContent #{timestamp.replace('-', '').replace(' ', '').replace(':', '')}",
-            "Caption generation failed": f"📝 Crafting the perfect words! Caption coming soon. #ContentCreation #{timestamp.replace('-', '').replace(' ', '').replace(':', '')}"
-        }
-        
-        return fallback_texts.get(error_type, f"🌟 Amazing content coming soon! Stay tuned! #{timestamp.replace('-', '').replace(' ', '').replace(':', '')}")
+        ts = datetime.now().strftime("%Y-%m-%d %H:%M").translate(_STRIP_TS)
+        return _FALLBACK_TEMPLATES.get(error_type, _DEFAULT_FALLBACK).format(ts=ts)
 
 def main():
     """Main entry point for content generation testing and GUI integration."""
@@ -6,29 +6,160 @@ Handles automated posting to Facebook page
 
 import os
 import sys
+import asyncio
 import json
 import logging
+import mmap
+import random
+import threading
+import httpx
 import requests
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from io import BytesIO
 from pathlib import Path
+from urllib.parse import urlencode
 from typing import Dict, Any, Optional, List
-from dotenv import load_dotenv
 import glob
+import gzip
+import importlib.util
 
-# Load environment variables
-load_dotenv()
+try:
+    from Automatizare_Completa.rate_limiter import RateLimiter, TokenBucket
+except ImportError:  # Running as a standalone script from inside the package dir
+    from rate_limiter import RateLimiter, TokenBucket
+
+try:
+    # Optional: streams multipart bodies instead of buffering them whole
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+try:
+    # Optional: C-accelerated JSON decoding for batch and error payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+def _parse_json(response) -> Any:
+    """Decode a response body, preferring orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses ValueError, so callers' existing
+    except ValueError handling covers both decoders.
+    """
+    if orjson is not None:
+        content = response.content
+        if isinstance(content, (bytes, bytearray, memoryview, str)):
+            return orjson.loads(content)
+    return response.json()
+
+# Load environment variables from .env only when the host has not already
+# configured them; skips the dotenv import and file probing otherwise
+if not os.environ.get("FACEBOOK_PAGE_TOKEN"):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 # Define project root
 PROJECT_ROOT = Path(__file__).parent.parent
 ASSET_TRACKING_FILE = PROJECT_ROOT / "Config" / "asset_tracking.json"
 
-# Get secrets from environment
+# Get secrets from environment (import-time snapshot; see _get_credential)
 FACEBOOK_PAGE_TOKEN = os.getenv("FACEBOOK_PAGE_TOKEN")
 FACEBOOK_PAGE_ID = os.getenv("FACEBOOK_PAGE_ID")
 FACEBOOK_APP_ID = os.getenv("FACEBOOK_APP_ID")
 
+def _get_credential(name: str, fallback: Optional[str]) -> Optional[str]:
+    """Resolve a credential from the environment at call time.
+
+    Reading the environment on every FacebookAutoPost() lets a rotated
+    secret take effect for new posters without reimporting the module; the
+    import-time snapshot above is only the fallback. A variable that is set
+    but empty counts as deliberately unset and does not fall back.
+    """
+    value = os.environ.get(name)
+    if value is not None:
+        value = value.strip()
+        if not value:
+            logger.warning(f"{name} is set but empty; treating as unset")
+            return None
+        return value
+    return fallback
+
+# Single source of truth for the Graph API version and root URL
+API_VERSION = "18.0"
+GRAPH_ROOT = f"https://graph.facebook.com/v{API_VERSION}"
+
+# How long a token-validity probe (either outcome) stays valid before we
+# hit the network again
+_TOKEN_TTL = 300.0
+
+# Media extensions accepted by the Graph API endpoints we use
+_VALID_IMAGE_EXT = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp'})
+_VALID_VIDEO_EXT = frozenset({'.mp4', '.mov', '.avi', '.wmv', '.mkv', '.flv', '.webm'})
+
+# 1x1 pixel PNG used as the self-test placeholder image, built once at import
+_PLACEHOLDER_PNG = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\tpHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\nIDATx\x9cc```\x00\x00\x00\x04\x00\x01\xdd\x8d\xb4\x1c\x00\x00\x00\x00IEND\xaeB`\x82'
+
+# Magic-byte prefixes for the image formats the Graph API accepts
+_IMAGE_MAGIC = (
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+    (b'BM', 'image/bmp'),
+)
+
+def _error_message(response) -> str:
+    """Extract the Graph API error message from a failed response.
+
+    Parses JSON first and only decodes raw bytes when the body is not JSON,
+    capped at 512 bytes with a fixed charset. This avoids response.text,
+    whose charset detection can scan an entire HTML error page just to
+    produce a string we immediately truncate.
+    """
+    try:
+        error_data = _parse_json(response)
+        return error_data.get('error', {}).get('message') or str(error_data)
+    except (ValueError, KeyError, AttributeError):
+        content = response.content
+        if isinstance(content, (bytes, bytearray)):
+            return content[:512].decode('utf-8', 'replace')
+        return str(content)[:512]
+
+# Maps transport exceptions to the stable error strings the result dicts use.
+# Order matters: ConnectTimeout is both a Timeout and a ConnectionError, and
+# the Timeout message should win.
+_ERROR_MAP = {
+    requests.exceptions.Timeout: "Request timed out",
+    requests.exceptions.ConnectionError: "Connection error",
+}
+
+def _request_error(exc: requests.exceptions.RequestException) -> str:
+    """Map a requests exception to its stable error message via _ERROR_MAP."""
+    for exc_type, message in _ERROR_MAP.items():
+        if isinstance(exc, exc_type):
+            return message
+    return f"Request error: {exc}"
+
+def _detect_image(path: Path) -> Optional[str]:
+    """Return the image MIME type from the file's magic bytes, or None.
+
+    The extension check catches typos; this catches mislabeled files (a
+    WebP renamed .jpg) locally in microseconds instead of after a full
+    120s upload that the Graph API then rejects.
+    """
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(12)
+    except OSError:
+        return None
+    for prefix, mime in _IMAGE_MAGIC:
+        if header.startswith(prefix):
+            return mime
+    return None
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -36,56 +167,281 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class _CircuitBreaker:
+    """CLOSED -> OPEN -> HALF_OPEN breaker that fails fast during outages.
+
+    After `threshold` consecutive failures the breaker opens and calls are
+    rejected immediately for `recovery` seconds, so a dead Graph API costs
+    O(1) per call instead of a 30-120s timeout each. One probe request is
+    let through in HALF_OPEN; its success closes the breaker again, its
+    failure re-opens it.
+    """
+
+    def __init__(self, threshold: int = 5, recovery: float = 30.0):
+        self.threshold = threshold
+        self.recovery = recovery
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = 0.0
+        self.state = "closed"
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed, claiming the probe slot in HALF_OPEN."""
+        with self._lock:
+            if self.state == "open":
+                if time.monotonic() - self._opened_at >= self.recovery:
+                    self.state = "half_open"
+                    return True
+                return False
+            if self.state == "half_open":
+                # A probe is already in flight
+                return False
+            return True
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        with self._lock:
+            self._failures = 0
+            self.state = "closed"
+
+    def record_failure(self) -> None:
+        """Count a failure; trip the breaker at the threshold or on a failed probe."""
+        with self._lock:
+            self._failures += 1
+            if self.state == "half_open" or self._failures >= self.threshold:
+                if self.state != "open":
+                    logger.warning(f"Circuit breaker opened after {self._failures} consecutive failures")
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
 class FacebookAutoPost:
     """Handles Facebook posting operations."""
     
     def __init__(self):
         """Initialize Facebook Auto Post."""
-        self.page_token = FACEBOOK_PAGE_TOKEN
-        self.page_id = FACEBOOK_PAGE_ID
-        self.app_id = FACEBOOK_APP_ID
+        self.page_token = _get_credential("FACEBOOK_PAGE_TOKEN", FACEBOOK_PAGE_TOKEN)
+        self.page_id = _get_credential("FACEBOOK_PAGE_ID", FACEBOOK_PAGE_ID)
+        self.app_id = _get_credential("FACEBOOK_APP_ID", FACEBOOK_APP_ID)
         
         # Validate credentials
         if not all([self.page_token, self.page_id]):
             logger.error("Missing Facebook credentials in environment variables!")
             raise ValueError("Facebook credentials not properly configured")
-        
+
+        # Persistent session so repeated posts reuse the TCP+TLS connection
+        # to graph.facebook.com instead of paying a handshake per call
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount("https://", adapter)
+        self._session.headers.update({
+            'User-Agent': 'SocialBoost-AutoPoster/3.0',
+            # Advertised explicitly so Graph compresses its large JSON
+            # bodies; br is only negotiated when brotli is installed
+            'Accept-Encoding': 'gzip, deflate, br',
+        })
+
+        # Client-side throttle so bursts stay under the Graph API bucket
+        self._rate_limiter = RateLimiter(max_per_minute=int(os.getenv("GRAPH_RPM", "60")))
+
+        # Token bucket mirroring the Graph hourly budget: the sliding window
+        # above smooths bursts, the bucket keeps the hourly total under the
+        # server's and turns 429s into scheduled waits instead of penalties
+        bucket_capacity = float(os.getenv("GRAPH_BUCKET_CAPACITY", "200"))
+        self._bucket = TokenBucket(capacity=bucket_capacity,
+                                   refill_rate=bucket_capacity / 3600.0)
+
+        # Last token-validity probe, keyed on the token it checked
+        # (see check_token_validity)
+        self._token_cache = {'token': None, 'ok': False, 'ts': 0.0}
+
+        # Last parsed Graph API usage headers (see _check_usage_headers)
+        self.usage: Dict[str, Any] = {}
+
+        # Graph API endpoints and auth params, formatted once per instance
+        # instead of per call
+        self._base_url = f"{GRAPH_ROOT}/{self.page_id}"
+        self._feed_url = f"{self._base_url}/feed"
+        self._photos_url = f"{self._base_url}/photos"
+        self._videos_url = f"{self._base_url}/videos"
+        self._auth_params = {'access_token': self.page_token}
+
+        # Bulkhead: bound concurrent image uploads so parallel callers
+        # cannot saturate upload bandwidth and trigger 429s
+        self._image_sem = threading.BoundedSemaphore(int(os.getenv("IMAGE_CONCURRENCY", "4")))
+
+        # Per-endpoint circuit breakers so a failing path (e.g. photo
+        # uploads) cannot disable the others
+        self._breakers = {
+            'feed': _CircuitBreaker(),
+            'photos': _CircuitBreaker(),
+            'videos': _CircuitBreaker(),
+        }
+
         logger.info("Facebook Auto Post initialized")
         logger.info(f"Page ID: {self.page_id}")
-    
-    def post_text(self, message: str) -> Dict[str, Any]:
-        """Post text message to Facebook page."""
-        logger.info(f"Posting text message: {message[:50]}...")
-        
-        # Validate input
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        try:
+            self._session.close()
+        except Exception:
+            pass
+
+    def __del__(self):
+        self.close()
+
+    def __enter__(self) -> "FacebookAutoPost":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @staticmethod
+    def _validate_message(message: str) -> Optional[str]:
+        """Return an error reason for an unusable message, or None if valid."""
         if not message or not message.strip():
-            logger.error("Empty message provided")
-            return {"status": "failed", "error": "Message cannot be empty"}
-        
-        # Construct Graph API URL
-        url = f"https://graph.facebook.com/v18.0/{self.page_id}/feed"
+            return "Message cannot be empty"
+        return None
+
+    @staticmethod
+    def _validate_media(path: Path, kind: str, valid_extensions: set) -> Optional[str]:
+        """Return an error reason for an unusable media file, or None if valid."""
+        # is_file() is False for missing paths too, so one stat covers both
+        if not path.is_file():
+            return f"{kind} file not found or invalid"
+        suffix = path.suffix
+        if suffix.lower() not in valid_extensions:
+            return f"Unsupported {kind.lower()} format: {suffix}"
+        return None
+
+    def _check_usage_headers(self, response) -> None:
+        """Parse Graph API usage headers and pause before the bucket overflows.
+
+        X-App-Usage / X-Page-Usage report call_count, total_time and
+        total_cputime as percentages of the rolling quota; past ~90% Facebook
+        starts throttling for minutes, so ducking early is much cheaper than
+        riding into the penalty box.
+        """
+        usage: Dict[str, Any] = {}
+        for header in ("X-App-Usage", "X-Page-Usage"):
+            try:
+                raw = response.headers.get(header)
+                if raw:
+                    usage.update(json.loads(raw))
+            except (ValueError, TypeError, AttributeError):
+                continue
+
+        if not usage:
+            return
+        self.usage = usage
+
+        try:
+            worst = max(float(usage.get(key) or 0)
+                        for key in ("call_count", "total_time", "total_cputime"))
+        except (ValueError, TypeError):
+            return
+
+        if worst >= 90.0:
+            pause = 60.0 * ((worst - 90.0) / 10.0 + 1.0)
+            logger.warning(f"Graph API usage at {worst:.0f}%, pausing {pause:.0f}s to stay under the limit")
+            time.sleep(pause)
+
+    @staticmethod
+    def _deadline_timeout(deadline, connect, read):
+        """Clamp a (connect, read) timeout to the remaining deadline budget.
+
+        Returns None when the budget is already spent. With no deadline the
+        per-try timeouts pass through unchanged.
+        """
+        if deadline is None:
+            return (connect, read)
+        budget = deadline - time.monotonic()
+        if budget <= 0:
+            return None
+        return (min(connect, budget), min(read, budget))
+
+    def _graph_post(self, url: str, *, data=None, files=None, headers=None,
+                    timeout=30) -> tuple:
+        """POST via the pooled session and parse the body in one place.
+
+        Returns (status_code, parsed_body_or_None, error_message_or_"") so
+        multi-stage flows like the resumable video upload do not each repeat
+        the status-check/parse/extract-error dance.
+        """
+        response = self._session.post(url, data=data, files=files,
+                                      headers=headers, timeout=timeout)
+        if response.status_code == 200:
+            return response.status_code, _parse_json(response), ""
+        return response.status_code, None, _error_message(response)
+
+    @staticmethod
+    def _backoff_delay(attempt: int, response=None) -> float:
+        """Delay before a retry: Retry-After when sent, else full jitter.
+
+        Full jitter (random 0..min(16, 0.5 * 2**attempt)) desynchronizes
+        retrying clients so they do not hammer the API in lockstep.
+        """
+        if response is not None:
+            try:
+                retry_after = float(response.headers.get('Retry-After'))
+                if retry_after > 0:
+                    return min(retry_after, 60.0)
+            except (TypeError, ValueError, AttributeError):
+                pass
+        return random.uniform(0, min(16.0, 0.5 * (2 ** attempt)))
+
+    def post_text(self, message: str, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """Post text message to Facebook page.
+
+        `deadline` is an absolute time.monotonic() value; retries and their
+        timeouts shrink to fit inside it, bounding total latency regardless
+        of how many attempts run.
+        """
+        logger.info("Posting text message: %.50s...", message)
+
+        # Validate input before any network work
+        error = self._validate_message(message)
+        if error:
+            logger.error(error)
+            return {"status": "failed", "error": error}
+
+        # Fail fast while the Graph API is known to be down
+        breaker = self._breakers['feed']
+        if not breaker.allow():
+            logger.warning("Circuit open for /feed; failing fast")
+            return {"status": "failed", "error": "circuit_open"}
+
+        # Graph API URL, formatted once in __init__
+        url = self._feed_url
         
         # Prepare parameters
-        params = {
-            'message': message,
-            'access_token': self.page_token
-        }
+        params = {'message': message, **self._auth_params}
         
         # Retry logic
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                logger.info(f"Making API call to: {url} (attempt {attempt + 1}/{max_retries})")
-                logger.debug(f"Parameters: message length={len(message)}, token present={bool(self.page_token)}")
-                
-                # Make the API call
-                response = requests.post(url, params=params, timeout=30)
-                
-                logger.info(f"API response status: {response.status_code}")
+                logger.info("Making API call to: %s (attempt %d/%d)", url, attempt + 1, max_retries)
+                logger.debug("Parameters: message length=%d, token present=%s", len(message), bool(self.page_token))
                 
+                # Make the API call over the pooled session (connect, read
+                # timeouts), clamped to whatever deadline budget remains
+                timeout = self._deadline_timeout(deadline, 5, 30)
+                if timeout is None:
+                    logger.error("✗ Deadline exceeded before attempt %d", attempt + 1)
+                    return {"status": "failed", "error": "deadline_exceeded"}
+                self._rate_limiter.wait_if_throttled()
+                self._bucket.acquire()
+                response = self._session.post(url, params=params, timeout=timeout)
+
+                logger.info("API response status: %s", response.status_code)
+                self._check_usage_headers(response)
+
                 if response.status_code == 200:
+                    self._rate_limiter.record_success()
+                    breaker.record_success()
                     # Success
-                    response_data = response.json()
+                    response_data = _parse_json(response)
                     post_id = response_data.get('id')
                     
                     logger.info(f"✓ Post successful! Post ID: {post_id}")
@@ -96,9 +452,15 @@ class FacebookAutoPost:
                     }
                 elif response.status_code in [429, 500, 502, 503, 504]:
                     # Retryable errors
+                    self._rate_limiter.record_failure()
+                    breaker.record_failure()
+                    if response.status_code == 429:
+                        self._bucket.penalize()
                     if attempt < max_retries - 1:
-                        wait_time = 2 ** attempt  # Exponential backoff
-                        logger.warning(f"Retryable error {response.status_code}. Retrying in {wait_time} seconds...")
+                        wait_time = self._backoff_delay(attempt, response)
+                        if deadline is not None:
+                            wait_time = min(wait_time, max(0.0, deadline - time.monotonic()))
+                        logger.warning(f"Retryable error {response.status_code}. Retrying in {wait_time:.1f} seconds...")
                         time.sleep(wait_time)
                         continue
                     else:
@@ -109,57 +471,33 @@ class FacebookAutoPost:
                         }
                 else:
                     # Non-retryable errors
-                    error_text = response.text
-                    logger.error(f"✗ Post failed with status {response.status_code}: {error_text}")
-                    
-                    try:
-                        error_data = response.json()
-                        error_message = error_data.get('error', {}).get('message', error_text)
-                    except json.JSONDecodeError:
-                        error_message = error_text
-                    
+                    error_message = _error_message(response)
+
+                    logger.error(f"✗ Post failed with status {response.status_code}: {error_message}")
+
                     return {
                         "status": "failed",
                         "error": error_message,
                         "status_code": response.status_code
                     }
                     
-            except requests.exceptions.Timeout:
-                if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt
-                    logger.warning(f"Request timed out. Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    logger.error("✗ Request timed out after 30 seconds")
-                    return {
-                        "status": "failed",
-                        "error": "Request timed out"
-                    }
-            except requests.exceptions.ConnectionError:
-                if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt
-                    logger.warning(f"Connection error. Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    logger.error("✗ Connection error occurred")
-                    return {
-                        "status": "failed",
-                        "error": "Connection error"
-                    }
             except requests.exceptions.RequestException as e:
+                # One table-driven handler instead of a branch per exception
+                # type; _ERROR_MAP supplies the stable message
+                breaker.record_failure()
+                error_message = _request_error(e)
                 if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt
-                    logger.warning(f"Request exception: {str(e)}. Retrying in {wait_time} seconds...")
+                    wait_time = self._backoff_delay(attempt)
+                    if deadline is not None:
+                        wait_time = min(wait_time, max(0.0, deadline - time.monotonic()))
+                    logger.warning(f"{error_message}. Retrying in {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
                     continue
-                else:
-                    logger.error(f"✗ Request exception: {str(e)}")
-                    return {
-                        "status": "failed",
-                        "error": f"Request error: {str(e)}"
-                    }
+                logger.error(f"✗ {error_message}")
+                return {
+                    "status": "failed",
+                    "error": error_message
+                }
             except Exception as e:
                 logger.error(f"✗ Unexpected error: {str(e)}")
                 return {
@@ -169,93 +507,256 @@ class FacebookAutoPost:
         
         # This should never be reached, but just in case
         return {"status": "failed", "error": "Unexpected error in retry logic"}
-    
-    def post_image(self, message: str, image_path: Path) -> Dict[str, Any]:
-        """Post image with text to Facebook page."""
-        logger.info(f"Posting image: {image_path} with message: {message[:50]}...")
-        
-        # Validate input
-        if not message or not message.strip():
-            logger.error("Empty message provided")
-            return {"status": "failed", "error": "Message cannot be empty"}
-        
-        # Validate image file
-        if not image_path.exists() or not image_path.is_file():
-            logger.error(f"Image file not found or invalid: {image_path}")
-            return {"status": "failed", "error": "Image file not found or invalid"}
-        
-        # Check file extension
-        valid_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp'}
-        if image_path.suffix.lower() not in valid_extensions:
-            logger.error(f"Unsupported image format: {image_path.suffix}")
-            return {"status": "failed", "error": f"Unsupported image format: {image_path.suffix}"}
+
+    def post_batch(self, messages: List[str], batch_size: int = 25) -> List[Dict[str, Any]]:
+        """Post several text messages using batched Graph API requests.
+
+        The Graph API accepts up to 50 sub-requests per call, so one batched
+        POST replaces up to batch_size TLS+HTTP round trips. Results come
+        back in input order with the same shape post_text returns.
+        """
+        batch_size = max(1, min(batch_size, 50))
+        logger.info(f"Posting {len(messages)} messages in batches of {batch_size}")
+
+        # Validate up front so bad messages never consume a batch slot
+        results: List[Optional[Dict[str, Any]]] = [None] * len(messages)
+        pending: List[tuple] = []
+        for index, message in enumerate(messages):
+            error = self._validate_message(message)
+            if error:
+                results[index] = {"status": "failed", "error": error}
+            else:
+                pending.append((index, message))
+
+        url = f"{GRAPH_ROOT}/"
+
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            batch = [
+                {
+                    "method": "POST",
+                    "relative_url": f"{self.page_id}/feed",
+                    "body": urlencode({"message": message})
+                }
+                for _, message in chunk
+            ]
+            # include_headers=false strips per-item response headers we
+            # never read, shrinking the batch response body
+            payload = {
+                'access_token': self.page_token,
+                'batch': json.dumps(batch),
+                'include_headers': 'false',
+            }
+
+            # Large batch bodies compress extremely well (repetitive form
+            # fields); gzip the urlencoded form past 4KB and tell Graph so
+            data: Any = payload
+            headers = None
+            body = urlencode(payload)
+            if len(body) > 4096:
+                data = gzip.compress(body.encode('utf-8'))
+                headers = {
+                    'Content-Encoding': 'gzip',
+                    'Content-Type': 'application/x-www-form-urlencoded',
+                }
+
+            self._rate_limiter.wait_if_throttled()
+            self._bucket.acquire()
+            try:
+                response = self._session.post(url, data=data, headers=headers, timeout=(5, 60))
+                self._check_usage_headers(response)
+
+                if response.status_code != 200:
+                    self._rate_limiter.record_failure()
+                    error_message = _error_message(response)
+                    logger.error(f"✗ Batch request failed with status {response.status_code}: {error_message}")
+                    for index, _ in chunk:
+                        results[index] = {
+                            "status": "failed",
+                            "error": error_message,
+                            "status_code": response.status_code
+                        }
+                    continue
+
+                self._rate_limiter.record_success()
+                for (index, _), item in zip(chunk, _parse_json(response)):
+                    if not item:
+                        results[index] = {"status": "failed", "error": "No response for batch item"}
+                        continue
+                    try:
+                        body = json.loads(item.get('body') or '{}')
+                    except ValueError:
+                        body = {}
+                    if item.get('code') == 200:
+                        results[index] = {
+                            "status": "success",
+                            "post_id": body.get('id'),
+                            "message": "Post created successfully"
+                        }
+                    else:
+                        results[index] = {
+                            "status": "failed",
+                            "error": body.get('error', {}).get('message', 'Unknown error'),
+                            "status_code": item.get('code')
+                        }
+            except requests.exceptions.RequestException as e:
+                logger.error(f"✗ Batch request failed: {str(e)}")
+                for index, _ in chunk:
+                    results[index] = {"status": "failed", "error": str(e)}
+
+        return [r if r is not None else {"status": "failed", "error": "No response for batch item"}
+                for r in results]
+
+    def post_image(self, message: str, image_path: Path, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """Post image with text to Facebook page.
+
+        `deadline` is an absolute time.monotonic() value; see post_text.
+        """
+        logger.info("Posting image: %s with message: %.50s...", image_path, message)
         
-        # Construct Graph API URL for photos
-        url = f"https://graph.facebook.com/v18.0/{self.page_id}/photos"
+        # Validate input before any network work
+        error = self._validate_message(message) or self._validate_media(
+            image_path, "Image", _VALID_IMAGE_EXT)
+        if error:
+            logger.error(f"{error} ({image_path})")
+            return {"status": "failed", "error": error}
+
+        # Check the actual content, not just the extension
+        image_mime = _detect_image(image_path)
+        if image_mime is None:
+            logger.error(f"Image content does not match a supported format: {image_path}")
+            return {"status": "failed", "error": "Image content does not match a supported format"}
+
+        # Fail fast while the Graph API is known to be down
+        breaker = self._breakers['photos']
+        if not breaker.allow():
+            logger.warning("Circuit open for /photos; failing fast")
+            return {"status": "failed", "error": "circuit_open", "image_path": str(image_path)}
+
+        # Graph API URL, formatted once in __init__
+        url = self._photos_url
         
         # Prepare payload (data, not params for file upload)
-        payload = {
-            'message': message,
-            'access_token': self.page_token
-        }
+        payload = {'message': message, **self._auth_params}
         
+        # Bulkhead: reject instead of queueing when the upload pool is full
+        if not self._image_sem.acquire(timeout=5):
+            logger.error("Image upload bulkhead saturated; rejecting")
+            return {"status": "failed", "error": "bulkhead_full", "image_path": str(image_path)}
+
+        # Retry logic (transient statuses and network errors only)
+        max_retries = 3
         try:
-            logger.info(f"Making API call to: {url}")
-            logger.debug(f"Image path: {image_path}, message length: {len(message)}")
-            
-            # Open image file and make the API call
+            # Open once and memory-map so retries resend bytes straight
+            # from the page cache instead of re-reading the file per attempt
             with open(image_path, 'rb') as image_file:
-                files = {'source': image_file}
-                
-                # Make the API call with longer timeout for file upload
-                response = requests.post(url, data=payload, files=files, timeout=120)
-            
-            logger.info(f"API response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                # Success
-                response_data = response.json()
-                post_id = response_data.get('id') or response_data.get('post_id')
-                
-                logger.info(f"✓ Image post successful! Post ID: {post_id}")
-                return {
-                    "status": "success",
-                    "post_id": post_id,
-                    "message": "Image post created successfully",
-                    "image_path": str(image_path)
-                }
-            else:
-                # Error
-                error_text = response.text
-                logger.error(f"✗ Image post failed with status {response.status_code}: {error_text}")
-                
                 try:
-                    error_data = response.json()
-                    error_message = error_data.get('error', {}).get('message', error_text)
-                except json.JSONDecodeError:
-                    error_message = error_text
-                
-                return {
-                    "status": "failed",
-                    "error": error_message,
-                    "status_code": response.status_code,
-                    "image_path": str(image_path)
-                }
-                
-        except requests.exceptions.Timeout:
-            logger.error("✗ Request timed out after 120 seconds")
-            return {
-                "status": "failed",
-                "error": "Request timed out (image upload)",
-                "image_path": str(image_path)
-            }
-        except requests.exceptions.ConnectionError:
-            logger.error("✗ Connection error occurred")
-            return {
-                "status": "failed",
-                "error": "Connection error",
-                "image_path": str(image_path)
-            }
+                    source = mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError, OverflowError, TypeError):
+                    # Empty file or no mmap support: stream the handle itself
+                    source = image_file
+                try:
+                    for attempt in range(max_retries):
+                        logger.info("Making API call to: %s (attempt %d/%d)", url, attempt + 1, max_retries)
+                        logger.debug("Image path: %s, message length: %d", image_path, len(message))
+
+                        try:
+                            # Rewind and make the API call with longer timeout for
+                            # file upload; retries resend the same mapped bytes,
+                            # clamped to whatever deadline budget remains
+                            timeout = self._deadline_timeout(deadline, 5, 120)
+                            if timeout is None:
+                                logger.error("✗ Deadline exceeded before attempt %d", attempt + 1)
+                                return {
+                                    "status": "failed",
+                                    "error": "deadline_exceeded",
+                                    "image_path": str(image_path)
+                                }
+                            source.seek(0)
+                            self._bucket.acquire()
+                            if MultipartEncoder is not None:
+                                # Streaming encoder: Content-Length comes from the
+                                # file size, so the body is never buffered whole
+                                encoder = MultipartEncoder(fields={
+                                    'message': message,
+                                    'access_token': self.page_token,
+                                    'source': (image_path.name, source, image_mime),
+                                })
+                                response = self._session.post(
+                                    url, data=encoder,
+                                    headers={'Content-Type': encoder.content_type},
+                                    timeout=timeout
+                                )
+                            else:
+                                files = {'source': (image_path.name, source, image_mime)}
+                                response = self._session.post(url, data=payload, files=files, timeout=timeout)
+                        except requests.exceptions.RequestException as e:
+                            # One table-driven handler instead of a branch per
+                            # exception type; _ERROR_MAP supplies the message
+                            breaker.record_failure()
+                            error_message = _request_error(e)
+                            if attempt < max_retries - 1:
+                                wait_time = self._backoff_delay(attempt)
+                                if deadline is not None:
+                                    wait_time = min(wait_time, max(0.0, deadline - time.monotonic()))
+                                logger.warning(f"{error_message}. Retrying in {wait_time:.1f} seconds...")
+                                time.sleep(wait_time)
+                                continue
+                            if isinstance(e, requests.exceptions.Timeout):
+                                error_message = "Request timed out (image upload)"
+                            logger.error(f"✗ {error_message}")
+                            return {
+                                "status": "failed",
+                                "error": error_message,
+                                "image_path": str(image_path)
+                            }
+
+                        logger.info("API response status: %s", response.status_code)
+                        self._check_usage_headers(response)
+
+                        if response.status_code == 200:
+                            breaker.record_success()
+                            # Success
+                            response_data = _parse_json(response)
+                            post_id = response_data.get('id') or response_data.get('post_id')
+
+                            logger.info(f"✓ Image post successful! Post ID: {post_id}")
+                            return {
+                                "status": "success",
+                                "post_id": post_id,
+                                "message": "Image post created successfully",
+                                "image_path": str(image_path)
+                            }
+                        elif response.status_code in [429, 500, 502, 503, 504] and attempt < max_retries - 1:
+                            # Retryable errors
+                            breaker.record_failure()
+                            if response.status_code == 429:
+                                self._bucket.penalize()
+                            wait_time = self._backoff_delay(attempt, response)
+                            if deadline is not None:
+                                wait_time = min(wait_time, max(0.0, deadline - time.monotonic()))
+                            logger.warning(f"Retryable error {response.status_code}. Retrying in {wait_time:.1f} seconds...")
+                            time.sleep(wait_time)
+                            continue
+                        else:
+                            # Non-retryable errors (or retries exhausted)
+                            error_message = _error_message(response)
+
+                            logger.error(f"✗ Image post failed with status {response.status_code}: {error_message}")
+
+                            return {
+                                "status": "failed",
+                                "error": error_message,
+                                "status_code": response.status_code,
+                                "image_path": str(image_path)
+                            }
+
+                finally:
+                    if source is not image_file:
+                        source.close()
+
+            return {"status": "failed", "error": "Unexpected error in retry logic", "image_path": str(image_path)}
+
         except requests.exceptions.RequestException as e:
             logger.error(f"✗ Request exception: {str(e)}")
             return {
@@ -277,27 +778,20 @@ class FacebookAutoPost:
                 "error": f"Unexpected error: {str(e)}",
                 "image_path": str(image_path)
             }
+        finally:
+            self._image_sem.release()
     
     def post_video(self, message: str, video_path: Path) -> Dict[str, Any]:
         """Post video with text to Facebook page using resumable upload."""
-        logger.info(f"Posting video: {video_path} with message: {message[:50]}...")
-        
-        # Validate input
-        if not message or not message.strip():
-            logger.error("Empty message provided")
-            return {"status": "failed", "error": "Message cannot be empty"}
-        
-        # Validate video file
-        if not video_path.exists() or not video_path.is_file():
-            logger.error(f"Video file not found or invalid: {video_path}")
-            return {"status": "failed", "error": "Video file not found or invalid"}
-        
-        # Check file extension
-        valid_extensions = {'.mp4', '.mov', '.avi', '.wmv', '.mkv', '.flv', '.webm'}
-        if video_path.suffix.lower() not in valid_extensions:
-            logger.error(f"Unsupported video format: {video_path.suffix}")
-            return {"status": "failed", "error": f"Unsupported video format: {video_path.suffix}"}
+        logger.info("Posting video: %s with message: %.50s...", video_path, message)
         
+        # Validate input before any network work
+        error = self._validate_message(message) or self._validate_media(
+            video_path, "Video", _VALID_VIDEO_EXT)
+        if error:
+            logger.error(f"{error} ({video_path})")
+            return {"status": "failed", "error": error}
+
         # Get file size
         try:
             file_size = video_path.stat().st_size
@@ -306,79 +800,121 @@ class FacebookAutoPost:
             logger.error(f"Could not get file size: {str(e)}")
             return {"status": "failed", "error": f"Could not get file size: {str(e)}"}
         
+        # Fail fast while the Graph API is known to be down
+        breaker = self._breakers['videos']
+        if not breaker.allow():
+            logger.warning("Circuit open for /videos; failing fast")
+            return {"status": "failed", "error": "circuit_open", "video_path": str(video_path)}
+
         # Construct Graph API URL for videos
-        url = f"https://graph.facebook.com/v18.0/{self.page_id}/videos"
-        
+        url = self._videos_url
+
         try:
             # Stage 1: Start Upload Session
             logger.info("Starting video upload session...")
             start_params = {
                 'upload_phase': 'start',
                 'file_size': file_size,
-                'access_token': self.page_token
+                **self._auth_params
             }
             
-            start_response = requests.post(url, data=start_params, timeout=30)
-            logger.info(f"Start upload response status: {start_response.status_code}")
+            status, start_data, error_message = self._graph_post(url, data=start_params, timeout=30)
+            logger.info(f"Start upload response status: {status}")
             
-            if start_response.status_code != 200:
-                error_text = start_response.text
-                logger.error(f"✗ Start upload failed with status {start_response.status_code}: {error_text}")
-                try:
-                    error_data = start_response.json()
-                    error_message = error_data.get('error', {}).get('message', error_text)
-                except json.JSONDecodeError:
-                    error_message = error_text
+            if status != 200:
+                breaker.record_failure()
+                logger.error(f"✗ Start upload failed with status {status}: {error_message}")
                 return {"status": "failed", "error": f"Start upload failed: {error_message}"}
             
-            start_data = start_response.json()
             video_id = start_data.get('video_id')
             upload_session_id = start_data.get('upload_session_id')
-            start_offset = start_data.get('start_offset', 0)
+            start_offset = int(start_data.get('start_offset', 0) or 0)
+            # Facebook returns its preferred first chunk span as end_offset
+            end_offset = int(start_data.get('end_offset', 0) or 0)
             
             logger.info(f"✓ Upload session started. Video ID: {video_id}, Session ID: {upload_session_id}")
             
             # Stage 2: Transfer File Chunks
             logger.info("Transferring video file chunks...")
-            chunk_size = 4 * 1024 * 1024  # 4MB chunks
+            chunk_size = 4 * 1024 * 1024  # 4MB fallback when no server hint
             current_offset = start_offset
             
             with open(video_path, 'rb') as video_file:
-                while current_offset < file_size:
-                    # Read chunk
-                    chunk_data = video_file.read(chunk_size)
-                    if not chunk_data:
-                        break
-                    
-                    logger.debug(f"Uploading chunk at offset {current_offset}, size {len(chunk_data)}")
-                    
-                    # Transfer chunk
-                    transfer_params = {
-                        'upload_phase': 'transfer',
-                        'upload_session_id': upload_session_id,
-                        'start_offset': current_offset,
-                        'access_token': self.page_token
-                    }
-                    
-                    files = {'video_file_chunk': chunk_data}
-                    
-                    transfer_response = requests.post(url, data=transfer_params, files=files, timeout=120)
-                    
-                    if transfer_response.status_code != 200:
-                        error_text = transfer_response.text
-                        logger.error(f"✗ Transfer failed at offset {current_offset}: {error_text}")
-                        try:
-                            error_data = transfer_response.json()
-                            error_message = error_data.get('error', {}).get('message', error_text)
-                        except json.JSONDecodeError:
-                            error_message = error_text
-                        return {"status": "failed", "error": f"Transfer failed: {error_message}"}
-                    
-                    transfer_data = transfer_response.json()
-                    new_offset = transfer_data.get('start_offset', current_offset + len(chunk_data))
-                    current_offset = new_offset
-                    
-                    logger.debug(f"✓ Chunk uploaded. New offset: {current_offset}")
+                # Memory-map the file so chunk bodies are zero-copy slices of
+                # the page cache instead of a fresh bytes object per chunk
+                try:
+                    video_map = mmap.mmap(video_file.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError, OverflowError, TypeError):
+                    # Empty file or no mmap support: read chunks the old way
+                    video_map = None
+                    video_file.seek(current_offset)
+                chunk_data = None
+                try:
+                    while current_offset < file_size:
+                        # Read up to the server-suggested offset when one was
+                        # given; a larger span means fewer round trips
+                        if end_offset > current_offset:
+                            read_size = end_offset - current_offset
+                        else:
+                            read_size = chunk_size
+                        if video_map is not None:
+                            chunk_data = memoryview(video_map)[current_offset:current_offset + read_size]
+                        else:
+                            chunk_data = video_file.read(read_size)
+                        if not len(chunk_data):
+                            break
+
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Uploading chunk at offset %d, size %d", current_offset, len(chunk_data))
+
+                        # Transfer chunk
+                        transfer_params = {
+                            'upload_phase': 'transfer',
+                            'upload_session_id': upload_session_id,
+                            'start_offset': current_offset,
+                            **self._auth_params
+                        }
+
+                        if MultipartEncoder is not None:
+                            # Streaming encoder: the chunk goes to the socket in
+                            # 8KB reads instead of being copied whole into the
+                            # multipart body a second time
+                            encoder = MultipartEncoder(fields={
+                                **{key: str(value) for key, value in transfer_params.items()},
+                                'video_file_chunk': ('chunk', BytesIO(chunk_data), 'application/octet-stream'),
+                            })
+                            status, transfer_data, error_message = self._graph_post(
+                                url, data=encoder,
+                                headers={'Content-Type': encoder.content_type},
+                                timeout=120
+                            )
+                        else:
+                            files = {'video_file_chunk': BytesIO(chunk_data)
+                                     if isinstance(chunk_data, memoryview) else chunk_data}
+                            status, transfer_data, error_message = self._graph_post(
+                                url, data=transfer_params, files=files, timeout=120)
+
+                        if status != 200:
+                            breaker.record_failure()
+                            logger.error(f"✗ Transfer failed at offset {current_offset}: {error_message}")
+                            return {"status": "failed", "error": f"Transfer failed: {error_message}"}
+
+                        new_offset = int(transfer_data.get('start_offset',
+                                                           current_offset + len(chunk_data)))
+                        end_offset = int(transfer_data.get('end_offset', 0) or 0)
+                        if video_map is None and new_offset != current_offset + len(chunk_data):
+                            # The server already has bytes past what we sent (or
+                            # wants a resend); resume reading where it asks
+                            video_file.seek(new_offset)
+                        current_offset = new_offset
+
+                        logger.debug("✓ Chunk uploaded. New offset: %d", current_offset)
+                finally:
+                    if video_map is not None:
+                        # Drop the exported slice first: mmap.close() raises
+                        # BufferError while a memoryview of the map is alive
+                        chunk_data = None
+                        video_map.close()
             
             logger.info("✓ All chunks transferred successfully")
             
@@ -388,51 +924,52 @@ class FacebookAutoPost:
                 'upload_phase': 'finish',
                 'upload_session_id': upload_session_id,
                 'description': message,
-                'access_token': self.page_token
+                **self._auth_params
             }
             
-            finish_response = requests.post(url, data=finish_params, timeout=30)
-            logger.info(f"Finish upload response status: {finish_response.status_code}")
+            status, finish_data, error_message = self._graph_post(url, data=finish_params, timeout=30)
+            logger.info(f"Finish upload response status: {status}")
             
-            if finish_response.status_code != 200:
-                error_text = finish_response.text
-                logger.error(f"✗ Finish upload failed with status {finish_response.status_code}: {error_text}")
-                try:
-                    error_data = finish_response.json()
-                    error_message = error_data.get('error', {}).get('message', error_text)
-                except json.JSONDecodeError:
-                    error_message = error_text
+            if status != 200:
+                breaker.record_failure()
+                logger.error(f"✗ Finish upload failed with status {status}: {error_message}")
                 return {"status": "failed", "error": f"Finish upload failed: {error_message}"}
-            
-            finish_data = finish_response.json()
+
             success = finish_data.get('success', False)
-            
+
             if not success:
+                breaker.record_failure()
                 logger.error("✗ Upload finish returned success=False")
                 return {"status": "failed", "error": "Upload finish failed"}
-            
+
+            breaker.record_success()
             logger.info(f"✓ Video upload completed successfully! Video ID: {video_id}")
             
             # Optional: Check video processing status
             logger.info("Checking video processing status...")
             max_checks = 10
-            check_interval = 5  # seconds
             
+            status_url = f"{GRAPH_ROOT}/{video_id}"
+            status_params = {
+                'fields': 'status{video_status,processing_progress}',
+                **self._auth_params
+            }
             for check_num in range(max_checks):
-                status_url = f"https://graph.facebook.com/v18.0/{video_id}"
-                status_params = {
-                    'fields': 'status',
-                    'access_token': self.page_token
-                }
                 
-                status_response = requests.get(status_url, params=status_params, timeout=30)
+                status_response = self._session.get(status_url, params=status_params, timeout=30)
                 
                 if status_response.status_code == 200:
-                    status_data = status_response.json()
-                    video_status = status_data.get('status', 'unknown')
+                    status_data = _parse_json(status_response)
+                    status_field = status_data.get('status', 'unknown')
+                    if isinstance(status_field, dict):
+                        video_status = status_field.get('video_status', 'unknown')
+                        progress = status_field.get('processing_progress')
+                    else:
+                        video_status = status_field
+                        progress = None
                     logger.info(f"Video status check {check_num + 1}: {video_status}")
                     
-                    if video_status == 'ready':
+                    if video_status == 'ready' or progress == 100:
                         logger.info("✓ Video is ready for viewing")
                         break
                     elif video_status == 'failed':
@@ -442,7 +979,10 @@ class FacebookAutoPost:
                     logger.warning(f"Status check failed: {status_response.status_code}")
                 
                 if check_num < max_checks - 1:
-                    time.sleep(check_interval)
+                    # Exponential spacing: recheck after 0.5s, doubling to a
+                    # 30s cap, so fast-processing videos return in ~1s instead
+                    # of waiting out fixed 5s intervals
+                    time.sleep(min(30.0, 0.5 * (2 ** check_num)))
             
             return {
                 "status": "success",
@@ -453,6 +993,7 @@ class FacebookAutoPost:
             }
             
         except requests.exceptions.Timeout:
+            breaker.record_failure()
             logger.error("✗ Request timed out")
             return {
                 "status": "failed",
@@ -460,6 +1001,7 @@ class FacebookAutoPost:
                 "video_path": str(video_path)
             }
         except requests.exceptions.ConnectionError:
+            breaker.record_failure()
             logger.error("✗ Connection error occurred")
             return {
                 "status": "failed",
@@ -467,6 +1009,7 @@ class FacebookAutoPost:
                 "video_path": str(video_path)
             }
         except requests.exceptions.RequestException as e:
+            breaker.record_failure()
             logger.error(f"✗ Request exception: {str(e)}")
             return {
                 "status": "failed",
@@ -499,12 +1042,13 @@ class FacebookAutoPost:
         Returns:
             Dict with status and post_id or error message
         """
-        logger.info(f"Scheduling post for {scheduled_time}: {message[:50]}...")
+        logger.info("Scheduling post for %s: %.50s...", scheduled_time, message)
 
-        # Validate input
-        if not message or not message.strip():
-            logger.error("Empty message provided")
-            return {"status": "failed", "error": "Message cannot be empty"}
+        # Validate input before any network work
+        error = self._validate_message(message)
+        if error:
+            logger.error(error)
+            return {"status": "failed", "error": error}
         if not isinstance(scheduled_time, datetime):
             logger.error("scheduled_time must be a datetime instance")
             return {"status": "failed", "error": "scheduled_time must be a datetime instance"}
@@ -526,20 +1070,20 @@ class FacebookAutoPost:
 
         scheduled_timestamp = int(scheduled_time.timestamp())
 
-        url = f"https://graph.facebook.com/v18.0/{self.page_id}/feed"
+        url = self._feed_url
         params = {
             'message': message,
             'published': False,  # Keep unpublished until scheduled time
             'scheduled_publish_time': scheduled_timestamp,
-            'access_token': self.page_token,
+            **self._auth_params,
         }
 
         try:
             logger.info(f"Making API call to schedule post for: {scheduled_time.isoformat()}")
-            response = requests.post(url, params=params, timeout=30)
-            logger.info(f"API response status: {response.status_code}")
+            response = self._session.post(url, params=params, timeout=30)
+            logger.info("API response status: %s", response.status_code)
             if response.status_code == 200:
-                response_data = response.json()
+                response_data = _parse_json(response)
                 post_id = response_data.get('id')
                 logger.info(f"✓ Post scheduled successfully! Post ID: {post_id}")
                 logger.info(f"   Will be published at: {scheduled_time.isoformat()}")
@@ -550,13 +1094,8 @@ class FacebookAutoPost:
                     "message": "Post scheduled successfully"
                 }
             else:
-                error_text = response.text
-                logger.error(f"✗ Scheduling failed with status {response.status_code}: {error_text}")
-                try:
-                    error_data = response.json()
-                    error_message = error_data.get('error', {}).get('message', error_text)
-                except json.JSONDecodeError:
-                    error_message = error_text
+                error_message = _error_message(response)
+                logger.error(f"✗ Scheduling failed with status {response.status_code}: {error_message}")
                 return {"status": "failed", "error": error_message, "status_code": response.status_code}
         except requests.exceptions.Timeout:
             logger.error("✗ Request timed out after 30 seconds")
@@ -584,24 +1123,32 @@ class FacebookAutoPost:
             logger.info("Mock token detected; treating as valid for tests")
             return True
 
+        # Repeated checks for the same token within the TTL reuse the last
+        # probe result, turning N checks into one network call
+        now = time.monotonic()
+        cache = self._token_cache
+        if cache['token'] == self.page_token and now - cache['ts'] < _TOKEN_TTL:
+            return cache['ok']
+
         try:
             # Test token with /me endpoint
-            url = "https://graph.facebook.com/v18.0/me"
-            params = {'access_token': self.page_token}
+            url = f"{GRAPH_ROOT}/me"
+            params = dict(self._auth_params)
 
             logger.info("Validating Facebook token...")
-            response = requests.get(url, params=params, timeout=10)
+            response = self._session.get(url, params=params, timeout=(5, 10))
 
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 token_name = data.get('name', 'Unknown')
                 token_id = data.get('id', 'Unknown')
                 logger.info(f"✓ Token is valid for: {token_name} (ID: {token_id})")
+                self._token_cache = {'token': self.page_token, 'ok': True, 'ts': now}
                 return True
             else:
-                error_data = response.json()
-                error_message = error_data.get('error', {}).get('message', 'Unknown error')
+                error_message = _error_message(response)
                 logger.error(f"✗ Token validation failed: {error_message}")
+                self._token_cache = {'token': self.page_token, 'ok': False, 'ts': now}
                 return False
 
         except requests.exceptions.Timeout:
@@ -614,6 +1161,146 @@ class FacebookAutoPost:
             logger.error(f"✗ Error validating token: {str(e)}")
             return False
 
+class AsyncFacebookAutoPost:
+    """Async sibling of FacebookAutoPost backed by httpx.AsyncClient.
+
+    Each sync post blocks a whole thread on network RTT; awaiting N posts
+    concurrently on one event loop collapses wall time from sum(RTT) towards
+    max(RTT) for scheduled queues and image batches.
+    """
+
+    def __init__(self):
+        """Initialize the async poster with the same credential checks."""
+        self.page_token = _get_credential("FACEBOOK_PAGE_TOKEN", FACEBOOK_PAGE_TOKEN)
+        self.page_id = _get_credential("FACEBOOK_PAGE_ID", FACEBOOK_PAGE_ID)
+        self.app_id = _get_credential("FACEBOOK_APP_ID", FACEBOOK_APP_ID)
+
+        if not all([self.page_token, self.page_id]):
+            logger.error("Missing Facebook credentials in environment variables!")
+            raise ValueError("Facebook credentials not properly configured")
+
+        # Graph API endpoints, formatted once instead of per call
+        self._feed_url = f"{GRAPH_ROOT}/{self.page_id}/feed"
+        self._photos_url = f"{GRAPH_ROOT}/{self.page_id}/photos"
+
+        self._client = httpx.AsyncClient(
+            # HTTP/2 multiplexes concurrent posts over one TLS connection and
+            # HPACK-compresses the repeated auth headers; requires the
+            # optional h2 package
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+            headers={
+                'User-Agent': 'SocialBoost-AutoPoster/3.0',
+                'Accept-Encoding': 'gzip, deflate, br',
+            },
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncFacebookAutoPost":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    @staticmethod
+    def _parse_error(response) -> str:
+        """Extract the Graph API error message from a failed response."""
+        return _error_message(response)
+
+    async def post_text(self, message: str) -> Dict[str, Any]:
+        """Post a text message to the Facebook page (async)."""
+        error = FacebookAutoPost._validate_message(message)
+        if error:
+            logger.error(error)
+            return {"status": "failed", "error": error}
+
+        url = self._feed_url
+        params = {'message': message, 'access_token': self.page_token}
+
+        try:
+            response = await self._client.post(url, params=params)
+            if response.status_code == 200:
+                post_id = _parse_json(response).get('id')
+                logger.info(f"✓ Post successful! Post ID: {post_id}")
+                return {
+                    "status": "success",
+                    "post_id": post_id,
+                    "message": "Post created successfully"
+                }
+            error_message = self._parse_error(response)
+            logger.error(f"✗ Post failed with status {response.status_code}: {error_message}")
+            return {"status": "failed", "error": error_message, "status_code": response.status_code}
+        except httpx.TimeoutException:
+            logger.error("✗ Request timed out")
+            return {"status": "failed", "error": "Request timed out"}
+        except Exception as e:
+            logger.error(f"✗ Unexpected error: {str(e)}")
+            return {"status": "failed", "error": f"Unexpected error: {str(e)}"}
+
+    async def post_image(self, message: str, image_path: Path) -> Dict[str, Any]:
+        """Post an image with text to the Facebook page (async)."""
+        error = FacebookAutoPost._validate_message(message) or FacebookAutoPost._validate_media(
+            image_path, "Image", _VALID_IMAGE_EXT)
+        if error:
+            logger.error(f"{error} ({image_path})")
+            return {"status": "failed", "error": error}
+
+        url = self._photos_url
+        payload = {'message': message, 'access_token': self.page_token}
+
+        try:
+            # Read in a worker thread so large files do not block the loop
+            image_data = await asyncio.to_thread(image_path.read_bytes)
+            files = {'source': (image_path.name, image_data)}
+            response = await self._client.post(
+                url, data=payload, files=files,
+                timeout=httpx.Timeout(120.0, connect=5.0)
+            )
+            if response.status_code == 200:
+                response_data = _parse_json(response)
+                post_id = response_data.get('id') or response_data.get('post_id')
+                logger.info(f"✓ Image post successful! Post ID: {post_id}")
+                return {
+                    "status": "success",
+                    "post_id": post_id,
+                    "message": "Image post created successfully",
+                    "image_path": str(image_path)
+                }
+            error_message = self._parse_error(response)
+            logger.error(f"✗ Image post failed with status {response.status_code}: {error_message}")
+            return {
+                "status": "failed",
+                "error": error_message,
+                "status_code": response.status_code,
+                "image_path": str(image_path)
+            }
+        except httpx.TimeoutException:
+            logger.error("✗ Request timed out")
+            return {"status": "failed", "error": "Request timed out", "image_path": str(image_path)}
+        except Exception as e:
+            logger.error(f"✗ Unexpected error: {str(e)}")
+            return {"status": "failed", "error": f"Unexpected error: {str(e)}", "image_path": str(image_path)}
+
+    async def post_many(self, messages: List[str]) -> List[Dict[str, Any]]:
+        """Post several text messages concurrently."""
+        logger.info(f"Posting {len(messages)} messages concurrently")
+        return list(await asyncio.gather(*(self.post_text(m) for m in messages)))
+
+def run_many(coros) -> List[Any]:
+    """Run async post coroutines from synchronous code on one event loop.
+
+    Bridges sync callers (the scheduler, the CLI) to AsyncFacebookAutoPost:
+    run_many([p.post_text(a), p.post_image(b, path)]) drives everything
+    concurrently and returns the results in input order.
+    """
+    async def _gather():
+        return list(await asyncio.gather(*coros))
+    return asyncio.run(_gather())
+
 def load_asset_tracking() -> dict:
     """Load asset tracking data from JSON file."""
     try:
@@ -641,7 +1328,7 @@ def save_asset_tracking(tracking_data: dict) -> None:
         
         with open(ASSET_TRACKING_FILE, 'w', encoding='utf-8') as f:
             json.dump(tracking_data, f, indent=2, ensure_ascii=False)
-        logger.debug(f"Asset tracking data saved to {ASSET_TRACKING_FILE}")
+        logger.debug("Asset tracking data saved to %s", ASSET_TRACKING_FILE)
     except Exception as e:
         logger.error(f"Error saving asset tracking data: {e}")
 
@@ -810,6 +1497,7 @@ def main():
     parser = argparse.ArgumentParser(description="Facebook Auto Post Module")
     parser.add_argument("--message", type=str, help="Message to post to Facebook")
     parser.add_argument("--selected-only", action='store_true', help='Post only assets listed in selected_assets.json')
+    parser.add_argument("--sequential", action='store_true', help='Run the self-tests one after another instead of concurrently')
     args = parser.parse_args()
     
     print("="*60)
@@ -909,17 +1597,57 @@ def main():
                         sys.exit(1)
                 else:
                     # Run full test suite if no message provided
-                    # Test post_text functionality
                     print("\n" + "="*60)
-                    print("Testing post_text functionality...")
+                    print("Testing post_text, post_image and post_video functionality...")
                     
                     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                     test_message = f"Test post from SocialBoost v3 via Cursor at {timestamp}"
                     
+                    # Check for test image
+                    test_image_path = Path("Assets/Images/test_image.png")
+                    if not test_image_path.exists():
+                        # Create a placeholder image for testing
+                        test_image_path.parent.mkdir(parents=True, exist_ok=True)
+                        print(f"Creating placeholder image at: {test_image_path}")
+                        
+                        # Write the precomputed 1x1 pixel PNG in one syscall
+                        test_image_path.write_bytes(_PLACEHOLDER_PNG)
+                    
+                    # Check for test video
+                    test_video_path = Path("Assets/Videos/test_video.mp4")
+                    if not test_video_path.exists():
+                        # Create a placeholder video for testing
+                        test_video_path.parent.mkdir(parents=True, exist_ok=True)
+                        print(f"Creating placeholder video at: {test_video_path}")
+                        
+                        # Create a minimal MP4 file (just header, no actual video data)
+                        mp4_header = b'\x00\x00\x00\x20ftypmp42\x00\x00\x00\x00mp41mp42isom\x00\x00\x00\x08mdat\x00\x00\x00\x00'
+                        
+                        with open(test_video_path, 'wb') as f:
+                            f.write(mp4_header)
+                    
+                    image_message = f"Test image post from SocialBoost v3 at {timestamp}"
+                    video_message = f"Test video post from SocialBoost v3 at {timestamp}"
                     print(f"Test message: {test_message}")
-                    print("Making API call...")
+                    print(f"Test image: {test_image_path}")
+                    print(f"Test video: {test_video_path}")
+                    print("Making API calls...")
                     
-                    result = poster.post_text(test_message)
+                    if args.sequential:
+                        result = poster.post_text(test_message)
+                        image_result = poster.post_image(image_message, test_image_path)
+                        video_result = poster.post_video(video_message, test_video_path)
+                    else:
+                        # requests releases the GIL during socket I/O and the
+                        # session is thread-safe, so the three self-tests
+                        # overlap instead of running back-to-back
+                        with ThreadPoolExecutor(max_workers=3) as executor:
+                            text_future = executor.submit(poster.post_text, test_message)
+                            image_future = executor.submit(poster.post_image, image_message, test_image_path)
+                            video_future = executor.submit(poster.post_video, video_message, test_video_path)
+                            result = text_future.result()
+                            image_result = image_future.result()
+                            video_result = video_future.result()
                     
                     print(f"\nResult: {result}")
                     
@@ -927,32 +1655,6 @@ def main():
                         print(f"✓ Post successful! Post ID: {result.get('post_id')}")
                     else:
                         print(f"✗ Post failed: {result.get('error')}")
-                
-                # Test post_image functionality
-                print("\n" + "="*60)
-                print("Testing post_image functionality...")
-                
-                # Check for test image
-                test_image_path = Path("Assets/Images/test_image.png")
-                if not test_image_path.exists():
-                    # Create a placeholder image for testing
-                    test_image_path.parent.mkdir(parents=True, exist_ok=True)
-                    print(f"Creating placeholder image at: {test_image_path}")
-                    
-                    # Create a simple 1x1 pixel PNG
-                    import struct
-                    png_data = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\tpHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\nIDATx\x9cc```\x00\x00\x00\x04\x00\x01\xdd\x8d\xb4\x1c\x00\x00\x00\x00IEND\xaeB`\x82'
-                    
-                    with open(test_image_path, 'wb') as f:
-                        f.write(png_data)
-                
-                if test_image_path.exists():
-                    image_message = f"Test image post from SocialBoost v3 at {timestamp}"
-                    print(f"Test image: {test_image_path}")
-                    print(f"Image message: {image_message}")
-                    print("Making image API call...")
-                    
-                    image_result = poster.post_image(image_message, test_image_path)
                     
                     print(f"\nImage Result: {image_result}")
                     
@@ -960,33 +1662,6 @@ def main():
                         print(f"✓ Image post successful! Post ID: {image_result.get('post_id')}")
                     else:
                         print(f"✗ Image post failed: {image_result.get('error')}")
-                else:
-                    print("✗ Could not create test image")
-                
-                # Test post_video functionality
-                print("\n" + "="*60)
-                print("Testing post_video functionality...")
-                
-                # Check for test video
-                test_video_path = Path("Assets/Videos/test_video.mp4")
-                if not test_video_path.exists():
-                    # Create a placeholder video for testing
-                    test_video_path.parent.mkdir(parents=True, exist_ok=True)
-                    print(f"Creating placeholder video at: {test_video_path}")
-                    
-                    # Create a minimal MP4 file (just header, no actual video data)
-                    mp4_header = b'\x00\x00\x00\x20ftypmp42\x00\x00\x00\x00mp41mp42isom\x00\x00\x00\x08mdat\x00\x00\x00\x00'
-                    
-                    with open(test_video_path, 'wb') as f:
-                        f.write(mp4_header)
-                
-                if test_video_path.exists():
-                    video_message = f"Test video post from SocialBoost v3 at {timestamp}"
-                    print(f"Test video: {test_video_path}")
-                    print(f"Video message: {video_message}")
-                    print("Making video API call...")
-                    
-                    video_result = poster.post_video(video_message, test_video_path)
                     
                     print(f"\nVideo Result: {video_result}")
                     
@@ -994,8 +1669,6 @@ def main():
                         print(f"✓ Video post successful! Video ID: {video_result.get('video_id')}")
                     else:
                         print(f"✗ Video post failed: {video_result.get('error')}")
-                else:
-                    print("✗ Could not create test video")
                     
             else:
                 print("✗ Token validation failed")
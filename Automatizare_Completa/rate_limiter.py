@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter Module - Client-side throttling for external API calls
+Sliding-window request limiting plus AIMD concurrency adjustment, shared by
+the OpenAI (auto_generate.py) and Facebook Graph API (auto_post.py) clients
+"""
+
+import collections
+import logging
+import threading
+import time
+from typing import Deque
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Sliding-window requests-per-minute limiter with AIMD backpressure.
+
+    Admission is controlled by a sliding window (60 seconds by default) of
+    request timestamps: when the window is full, wait_if_throttled() sleeps
+    until the oldest request falls out, so steady-state throughput sits at
+    the provider ceiling instead of bouncing off 429 retry penalties.
+
+    The concurrency hint follows additive-increase/multiplicative-decrease:
+    each 429/5xx halves it (floor 1), a run of successes slowly raises it
+    back (additive step 0.5, capped at max_concurrency). Callers that fan out
+    work can size their pools from the `concurrency` property.
+    """
+
+    def __init__(self, max_per_minute: int = 60, max_concurrency: int = 8,
+                 success_threshold: int = 5, window_seconds: float = 60.0):
+        self.max_per_minute = max_per_minute
+        self.max_concurrency = max_concurrency
+        self.success_threshold = success_threshold
+        self.window_seconds = window_seconds
+
+        self._timestamps: Deque[float] = collections.deque()
+        self._lock = threading.Lock()
+        self._concurrency = float(max_concurrency)
+        self._consecutive_successes = 0
+
+    @property
+    def concurrency(self) -> int:
+        """Current AIMD-adjusted concurrency hint (at least 1)."""
+        return max(1, int(self._concurrency))
+
+    def wait_if_throttled(self) -> None:
+        """Block until a request slot is free, then claim it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                # Drop timestamps that fell out of the sliding window
+                while self._timestamps and now - self._timestamps[0] >= self.window_seconds:
+                    self._timestamps.popleft()
+
+                if len(self._timestamps) < self.max_per_minute:
+                    self._timestamps.append(now)
+                    return
+
+                wait_time = self.window_seconds - (now - self._timestamps[0])
+
+            logger.warning(f"Rate limit window full ({self.max_per_minute}/{self.window_seconds:.0f}s), waiting {wait_time:.1f}s")
+            time.sleep(max(wait_time, 0.05))
+
+    def record_success(self) -> None:
+        """Additive increase: slowly restore concurrency after a clean run."""
+        with self._lock:
+            self._consecutive_successes += 1
+            if self._consecutive_successes >= self.success_threshold:
+                self._consecutive_successes = 0
+                self._concurrency = min(self._concurrency + 0.5, float(self.max_concurrency))
+
+    def record_failure(self) -> None:
+        """Multiplicative decrease: halve concurrency on 429/5xx responses."""
+        with self._lock:
+            self._consecutive_successes = 0
+            old = self.concurrency
+            self._concurrency = max(self._concurrency * 0.5, 1.0)
+            if self.concurrency != old:
+                logger.warning(f"Backpressure: concurrency reduced {old} -> {self.concurrency}")
+
+
+class TokenBucket:
+    """Token-bucket limiter mirroring the provider's own refill budget.
+
+    Unlike the sliding window above, which smooths short bursts, the bucket
+    tracks a continuously refilling budget (e.g. the Graph API's ~200 calls
+    per hour): acquire() spends tokens and blocks only when the budget is
+    exhausted, and penalize() drives the balance negative after a 429 so the
+    next acquire waits out a full refill interval instead of re-triggering
+    the server-side penalty.
+    """
+
+    def __init__(self, capacity: float = 200.0, refill_rate: float = 200.0 / 3600.0):
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_rate)
+        self._last_refill = now
+
+    @property
+    def tokens(self) -> float:
+        """Current token balance after refilling to now."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    def acquire(self, weight: float = 1.0) -> None:
+        """Block until `weight` tokens are available, then spend them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= weight:
+                    self._tokens -= weight
+                    return
+                wait_time = (weight - self._tokens) / self.refill_rate
+
+            logger.warning(f"Token bucket empty, waiting {wait_time:.1f}s for refill")
+            time.sleep(wait_time)
+
+    def penalize(self) -> None:
+        """Apply a 429 penalty: the next acquire waits a full refill."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -1.0)
@@ -7,18 +7,36 @@ Reads jobs from Config/schedule.json and runs Python scripts at specified interv
 import os
 import sys
 import json
-import time
+import collections
 import schedule
 import subprocess
 import logging
 import datetime
+import importlib
+import copy
 import io
+import threading
+import queue
+import atexit
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeout
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+_ENV_LOADED = False
+
+
+def _ensure_env() -> None:
+    """Load .env once per process, skipping the walk when inherited.
+
+    Children launched by the scheduler receive the resolved environment
+    plus an SB_ENV_LOADED sentinel, so they never re-parse .env.
+    """
+    global _ENV_LOADED
+    if not _ENV_LOADED and not os.environ.get("SB_ENV_LOADED"):
+        load_dotenv()
+    _ENV_LOADED = True
 
 # Force UTF-8 encoding for stdout/stderr to prevent UnicodeEncodeError
 if hasattr(sys.stdout, "reconfigure"):
@@ -45,16 +63,88 @@ logger.setLevel(logging.INFO)
 # File Handler with UTF-8 encoding
 file_handler = logging.FileHandler(log_file, encoding='utf-8', errors='replace')
 file_handler.setFormatter(log_formatter)
-logger.addHandler(file_handler)
 
 # Console Handler with UTF-8 support
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(log_formatter)
-logger.addHandler(console_handler)
+
+# Batch file writes: records accumulate in memory and reach the disk
+# once per batch, immediately on ERROR, and on close
+mem_handler = MemoryHandler(
+    capacity=512, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True
+)
+
+# The scheduler thread only enqueues records; a listener thread owns the
+# file and console handlers, so logging never blocks on disk or terminal
+log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+logger.addHandler(QueueHandler(log_queue))
+_log_listener = QueueListener(
+    log_queue, mem_handler, console_handler, respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+
+def _flush_log_buffer() -> None:
+    """Flush buffered log records every few seconds to bound staleness."""
+    mem_handler.flush()
+    timer = threading.Timer(5.0, _flush_log_buffer)
+    timer.daemon = True
+    timer.start()
+
+
+_flush_log_buffer()
+
+# Valid weekday names for weekly jobs, matching schedule's day methods
+_DAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+
+def _preimport():
+    """Warm a pool worker by importing the heavy task modules once.
+
+    Runs in the worker process; later task dispatches then skip the
+    interpreter-startup and import cost a fresh subprocess would pay.
+    """
+    sys.path.insert(0, str(PROJECT_ROOT))
+    sys.path.insert(0, str(PROJECT_ROOT / "Automatizare_Completa"))
+    for module_name in ('auto_post', 'auto_generate', 'backup_manager'):
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            # The task will report its own failure when dispatched
+            pass
+
+
+def _run_entrypoint(module_name: str, argv: List[str]) -> int:
+    """Run a task module's main() inside a pool worker.
+
+    Args:
+        module_name: Importable module with a main() entry point.
+        argv: Command-line arguments the task would have received.
+
+    Returns:
+        The task's exit code (0 on success).
+    """
+    sys.argv = [module_name + '.py'] + argv
+    try:
+        module = importlib.import_module(module_name)
+        result = module.main()
+        return int(result or 0)
+    except SystemExit as e:
+        return int(e.code or 0)
+
 
 class TaskScheduler:
     """Automated task scheduling system."""
-    
+
+    # Tasks with an importable main() run in the warm worker pool;
+    # anything else falls back to a one-shot subprocess
+    _ENTRYPOINTS: Dict[str, Tuple[str, List[str]]] = {
+        'auto_post.py': ('auto_post', []),
+        'auto_generate.py': ('auto_generate', []),
+        'backup_manager.py': ('backup_manager', ['create'])
+    }
+
     def __init__(self, project_root: Optional[Path] = None):
         self.project_root = project_root or Path.cwd()
         self.config_dir = self.project_root / "Config"
@@ -64,9 +154,31 @@ class TaskScheduler:
         # Ensure directories exist
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.automatizare_dir.mkdir(parents=True, exist_ok=True)
-        
+
+        # Worker pool is created lazily on the first pooled dispatch
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        # Parsed schedule keyed on the file's (mtime_ns, size), plus the
+        # last bytes written so unchanged saves can be skipped
+        self._schedule_cache: Optional[Tuple[int, int, Dict[str, Any]]] = None
+        self._schedule_bytes: Optional[bytes] = None
+
+        # Per-task script path and command, resolved once instead of on
+        # every fire
+        self._prepared: Dict[str, Dict[str, Any]] = {}
+
+        # Environment for child processes; the sentinel lets them skip
+        # their own .env walk
+        self._child_env: Dict[str, str] = {**os.environ, 'SB_ENV_LOADED': '1'}
+
         logger.info(f"Scheduler initialized. Project root: {self.project_root}")
         logger.info(f"Schedule file: {self.schedule_file}")
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Return the shared worker pool, creating it on first use."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=2, initializer=_preimport)
+        return self._pool
     
     def load_schedule(self) -> Dict[str, Any]:
         """Load schedule configuration from JSON file."""
@@ -104,11 +216,17 @@ class TaskScheduler:
                 self.save_schedule(default_schedule)
                 return default_schedule
             
+            # Serve the cached parse while the file is unchanged on disk
+            st = self.schedule_file.stat()
+            if self._schedule_cache is not None and self._schedule_cache[:2] == (st.st_mtime_ns, st.st_size):
+                return copy.deepcopy(self._schedule_cache[2])
+
             with open(self.schedule_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
+                self._schedule_cache = (st.st_mtime_ns, st.st_size, copy.deepcopy(data))
                 logger.info(f"Loaded {len(data.get('jobs', []))} jobs from schedule")
                 return data
-                
+
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in schedule file: {e}")
             return {"jobs": []}
@@ -119,56 +237,122 @@ class TaskScheduler:
     def save_schedule(self, data: Dict[str, Any]) -> None:
         """Save schedule configuration to JSON file."""
         try:
-            with open(self.schedule_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                logger.info("Schedule saved successfully")
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+            if payload == self._schedule_bytes:
+                logger.info("Schedule unchanged, skipping write")
+                return
+
+            # Write to a temp file and swap it in so readers never see
+            # a partially written schedule
+            tmp_path = self.schedule_file.with_suffix('.json.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.schedule_file)
+
+            self._schedule_bytes = payload
+            st = self.schedule_file.stat()
+            self._schedule_cache = (st.st_mtime_ns, st.st_size, copy.deepcopy(data))
+            logger.info("Schedule saved successfully")
         except Exception as e:
             logger.error(f"Error saving schedule: {e}")
     
+    def _prepare_task(self, task_name: str) -> Dict[str, Any]:
+        """Resolve a task's script path and command once, ahead of its fires."""
+        script_path = self.automatizare_dir / task_name
+        cmd = [sys.executable, str(script_path)]
+        return {
+            'path': script_path,
+            'exists': script_path.exists(),
+            'cmd': cmd,
+            'cmd_str': ' '.join(cmd)
+        }
+
     def run_task(self, job: Dict[str, Any]) -> None:
         """Run a scheduled task."""
         try:
             task_name = job.get('task', '')
             description = job.get('description', 'No description')
-            
+
             logger.info(f"Running task: {task_name} - {description}")
-            
-            # Construct script path
-            script_path = self.automatizare_dir / task_name
-            
+
+            # Look up the precomputed script path and command
+            prepared = self._prepared.get(task_name)
+            if prepared is None:
+                prepared = self._prepare_task(task_name)
+                self._prepared[task_name] = prepared
+
             # Check if script exists
-            if not script_path.exists():
-                logger.error(f"Script not found: {script_path}")
+            if not prepared['exists']:
+                logger.error(f"Script not found: {prepared['path']}")
                 return
-            
-            # Build command with arguments
-            cmd = [sys.executable, str(script_path)]
-            
-            # Add default arguments for specific tasks
-            if task_name == "backup_manager.py":
-                cmd.append("create")  # Add 'create' action for backup_manager
-            
-            # Run the script
-            logger.info(f"Executing: {' '.join(cmd)}")
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=self.project_root,
-                timeout=300,  # 5 minute timeout
-                encoding='utf-8',
-                errors='replace'
-            )
-            
-            # Log results
-            if result.returncode == 0:
-                logger.info(f"SUCCESS - Task {task_name} completed successfully")
-                if result.stdout:
-                    logger.info(f"Output: {result.stdout[:200]}...")
+
+            entrypoint = self._ENTRYPOINTS.get(task_name)
+            if entrypoint is not None:
+                # Known tasks run in a warm worker process, skipping the
+                # interpreter startup a fresh subprocess pays every fire
+                module_name, argv = entrypoint
+                logger.info(f"Dispatching {task_name} to the worker pool")
+                future = self._get_pool().submit(_run_entrypoint, module_name, argv)
+                try:
+                    returncode = future.result(timeout=300)
+                except FuturesTimeout:
+                    # The worker is stuck inside the entrypoint and cannot
+                    # be cancelled; retire the whole pool so later fires
+                    # get fresh workers instead of queueing behind it
+                    self._pool.shutdown(wait=False)
+                    self._pool = None
+                    raise
+
+                if returncode == 0:
+                    logger.info(f"SUCCESS - Task {task_name} completed successfully")
+                else:
+                    logger.error(f"FAIL - Task {task_name} failed with return code {returncode}")
             else:
-                logger.error(f"FAIL - Task {task_name} failed with return code {result.returncode}")
-                if result.stderr:
-                    logger.error(f"Error: {result.stderr[:200]}...")
+                # Run the script, streaming output so a chatty child
+                # cannot balloon scheduler memory
+                logger.info(f"Executing: {prepared['cmd_str']}")
+                proc = subprocess.Popen(
+                    prepared['cmd'],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                    cwd=self.project_root,
+                    env=self._child_env,
+                    encoding='utf-8',
+                    errors='replace'
+                )
+
+                # Keep only the last few lines for the log; the reader
+                # runs on its own thread so a child that hangs without
+                # closing stdout cannot dodge the deadline below
+                tail: collections.deque = collections.deque(maxlen=20)
+
+                def _drain() -> None:
+                    for line in proc.stdout:
+                        tail.append(line)
+
+                reader = threading.Thread(target=_drain, daemon=True)
+                reader.start()
+                try:
+                    returncode = proc.wait(timeout=300)  # 5 minute timeout
+                except subprocess.TimeoutExpired:
+                    # Kill the hung child; the reader exits when the
+                    # pipe closes behind it
+                    proc.kill()
+                    proc.wait()
+                    raise
+                reader.join(timeout=5)
+
+                # Log results
+                if returncode == 0:
+                    logger.info(f"SUCCESS - Task {task_name} completed successfully")
+                    if tail:
+                        logger.info(f"Output: {''.join(tail)[:200]}...")
+                else:
+                    logger.error(f"FAIL - Task {task_name} failed with return code {returncode}")
+                    if tail:
+                        logger.error(f"Error: {''.join(tail)[:200]}...")
             
             # Update job status
             job['last_run'] = datetime.datetime.now().isoformat()
@@ -178,7 +362,7 @@ class TaskScheduler:
                 job['executed'] = True
                 logger.info(f"One-time job {task_name} marked as executed")
                 
-        except subprocess.TimeoutExpired:
+        except (subprocess.TimeoutExpired, FuturesTimeout):
             logger.error(f"Task {task_name} timed out after 5 minutes")
         except Exception as e:
             logger.error(f"Error running task {task_name}: {e}")
@@ -194,16 +378,23 @@ class TaskScheduler:
             
             job_type = job.get('type', '')
             task_name = job.get('task', '')
-            
+
+            # Resolve the script path once per task instead of per fire
+            if task_name and task_name not in self._prepared:
+                self._prepared[task_name] = self._prepare_task(task_name)
+
             if job_type == 'daily':
                 time_str = job.get('time', '09:00')
                 schedule.every().day.at(time_str).do(self.run_task, job=job)
                 logger.info(f"Scheduled daily job: {task_name} at {time_str}")
                 
             elif job_type == 'weekly':
-                day = job.get('day', 'monday')
+                day = job.get('day', 'monday').lower()
+                if day not in _DAYS:
+                    logger.warning(f"Invalid day '{day}' for weekly job {task_name}, skipping")
+                    continue
                 time_str = job.get('time', '09:00')
-                getattr(schedule.every(), day.lower()).at(time_str).do(self.run_task, job=job)
+                getattr(schedule.every(), day).at(time_str).do(self.run_task, job=job)
                 logger.info(f"Scheduled weekly job: {task_name} on {day} at {time_str}")
                 
             elif job_type == 'interval':
@@ -251,21 +442,30 @@ class TaskScheduler:
         self.save_schedule(schedule_data)
         
         logger.info("Scheduler is running. Press Ctrl+C to stop.")
-        
+
         try:
-            while True:
+            # Sleep until the next job is due instead of polling every
+            # second; the event lets Ctrl+C wake the loop immediately
+            stop_event = threading.Event()
+            while not stop_event.is_set():
                 schedule.run_pending()
-                time.sleep(1)
+                idle = schedule.idle_seconds()
+                if idle is None:
+                    idle = 60
+                stop_event.wait(timeout=max(0.0, min(idle, 60.0)))
         except KeyboardInterrupt:
             logger.info("Scheduler stopped by user")
         except Exception as e:
             logger.error(f"Scheduler error: {e}")
         finally:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
             logger.info("Scheduler shutdown complete")
 
 def main():
     """Main entry point for the scheduler."""
     try:
+        _ensure_env()
         scheduler = TaskScheduler()
         scheduler.run_scheduler()
     except Exception as e:
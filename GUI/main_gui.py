@@ -6,6 +6,8 @@ Tkinter-based GUI for managing Facebook automated posting and content generation
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+import asyncio
+import os
 import subprocess
 import threading
 import sys
@@ -20,14 +22,25 @@ import datetime
 
 class SocialBoostApp(tk.Tk):
     """Main application class for SocialBoost Facebook AutoPoster GUI."""
-    
+
+    # Caps on scrolled-text size so a long session keeps constant memory
+    # and insert time instead of growing the widgets without bound
+    MAX_LOG_LINES = 5000
+    MAX_RESULT_LINES = 500
+
+
     def __init__(self) -> None:
         """Initialize the main application window."""
         super().__init__()
         
         # Load environment variables
         load_dotenv()
-        
+
+        # Environment for child processes; the sentinel lets them skip
+        # their own .env walk
+        self._child_env: Dict[str, str] = {**os.environ, 'SB_ENV_LOADED': '1'}
+
+
         # Set up project root path
         self.PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
         
@@ -35,8 +48,15 @@ class SocialBoostApp(tk.Tk):
         # This prevents AttributeError if any method tries to access these early
         self.assets_dict: Dict[str, str] = {}
         self.preview_image: Optional[ImageTk.PhotoImage] = None
+        self._log_buf: List[str] = []
+        self._log_flush_scheduled = False
         self.scheduler_process: Optional[subprocess.Popen] = None
-        
+
+        # One background event loop runs all test-action child processes,
+        # instead of spawning a blocked thread per button click
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
         # Initialize GUI components
         self.setup_window()
         self.setup_notebook()
@@ -529,19 +549,35 @@ class SocialBoostApp(tk.Tk):
     def setup_queue(self) -> None:
         """Setup the queue for thread-safe GUI updates."""
         self.queue: Queue[Dict[str, Any]] = Queue()
-        self.check_queue()
-        
-    def check_queue(self) -> None:
-        """Check for messages in the queue and update GUI accordingly."""
+        # Producers raise a virtual event after each put, so the mainloop
+        # only wakes when there is actually something to drain
+        self.bind("<<QueueMsg>>", self._drain_queue)
+        self.after(1000, self._queue_safety_net)
+
+    def queue_put(self, message: Dict[str, Any]) -> None:
+        """Enqueue a GUI update and wake the mainloop (thread-safe)."""
+        self.queue.put(message)
+        try:
+            self.event_generate("<<QueueMsg>>", when="tail")
+        except tk.TclError:
+            # Window is being torn down; the safety net drains the rest
+            pass
+
+    def _drain_queue(self, event: Any = None) -> None:
+        """Drain all pending messages from the queue in one pass."""
         try:
             while True:
                 message = self.queue.get_nowait()
                 self.handle_queue_message(message)
         except Exception:
             pass
-        finally:
-            self.after(100, self.check_queue)
-            
+
+    def _queue_safety_net(self) -> None:
+        """Periodic fallback drain in case a wake event was lost."""
+        self._drain_queue()
+        self.after(1000, self._queue_safety_net)
+
+
     def handle_queue_message(self, message: Dict[str, Any]) -> None:
         """Handle messages from the queue."""
         msg_type = message.get('type')
@@ -554,6 +590,7 @@ class SocialBoostApp(tk.Tk):
             self.result_text.config(state='normal')
             self.result_text.delete(1.0, tk.END)
             self.result_text.insert(1.0, message.get('text', ''))
+            self._trim_text_widget(self.result_text, self.MAX_RESULT_LINES)
             self.result_text.config(state='disabled')
         elif msg_type == 'log':
             self.add_log(message.get('text', ''))
@@ -645,7 +682,7 @@ class SocialBoostApp(tk.Tk):
     def run_health_check(self) -> None:
         """Run health check script in a separate thread."""
         self.health_check_btn.config(state='disabled')
-        self.queue.put({'type': 'log', 'text': 'Starting health check...'})
+        self.queue_put({'type': 'log', 'text': 'Starting health check...'})
         
         thread = threading.Thread(target=self._run_health_check_thread)
         thread.daemon = True
@@ -657,36 +694,37 @@ class SocialBoostApp(tk.Tk):
             script_path = self.PROJECT_ROOT / "Automatizare_Completa" / "health_check.py"
             
             if not script_path.exists():
-                self.queue.put({'type': 'error', 'text': f'Health check script not found: {script_path}'})
+                self.queue_put({'type': 'error', 'text': f'Health check script not found: {script_path}'})
                 return
             
             result = subprocess.run(
                 [sys.executable, str(script_path)],
                 capture_output=True,
                 text=True,
-                cwd=str(self.PROJECT_ROOT)
+                cwd=str(self.PROJECT_ROOT),
+                env=self._child_env
             )
             
             if result.returncode == 0:
-                self.queue.put({'type': 'success', 'text': 'Health check completed successfully!'})
-                self.queue.put({'type': 'log', 'text': 'Health check completed - see Logs/health_check.json for details'})
+                self.queue_put({'type': 'success', 'text': 'Health check completed successfully!'})
+                self.queue_put({'type': 'log', 'text': 'Health check completed - see Logs/health_check.json for details'})
                 # Refresh status after health check
                 self.after(0, self.load_project_status_gui)
             else:
                 error_msg = result.stderr or "Unknown error during health check"
-                self.queue.put({'type': 'error', 'text': f'Health check failed: {error_msg}'})
-                self.queue.put({'type': 'log', 'text': f'Health check error: {error_msg}'})
+                self.queue_put({'type': 'error', 'text': f'Health check failed: {error_msg}'})
+                self.queue_put({'type': 'log', 'text': f'Health check error: {error_msg}'})
                 
         except Exception as e:
-            self.queue.put({'type': 'error', 'text': f'Error running health check: {str(e)}'})
-            self.queue.put({'type': 'log', 'text': f'Health check exception: {str(e)}'})
+            self.queue_put({'type': 'error', 'text': f'Error running health check: {str(e)}'})
+            self.queue_put({'type': 'log', 'text': f'Health check exception: {str(e)}'})
         finally:
             self.after(0, lambda: self.health_check_btn.config(state='normal'))
     
     def run_backup(self) -> None:
         """Run backup script in a separate thread."""
         self.backup_btn.config(state='disabled')
-        self.queue.put({'type': 'log', 'text': 'Starting backup...'})
+        self.queue_put({'type': 'log', 'text': 'Starting backup...'})
         
         thread = threading.Thread(target=self._run_backup_thread)
         thread.daemon = True
@@ -698,27 +736,28 @@ class SocialBoostApp(tk.Tk):
             script_path = self.PROJECT_ROOT / "backup_manager.py"
             
             if not script_path.exists():
-                self.queue.put({'type': 'error', 'text': f'Backup script not found: {script_path}'})
+                self.queue_put({'type': 'error', 'text': f'Backup script not found: {script_path}'})
                 return
             
             result = subprocess.run(
                 [sys.executable, str(script_path)],
                 capture_output=True,
                 text=True,
-                cwd=str(self.PROJECT_ROOT)
+                cwd=str(self.PROJECT_ROOT),
+                env=self._child_env
             )
             
             if result.returncode == 0:
-                self.queue.put({'type': 'success', 'text': 'Backup created successfully!'})
-                self.queue.put({'type': 'log', 'text': 'Backup completed successfully'})
+                self.queue_put({'type': 'success', 'text': 'Backup created successfully!'})
+                self.queue_put({'type': 'log', 'text': 'Backup completed successfully'})
             else:
                 error_msg = result.stderr or "Unknown error during backup"
-                self.queue.put({'type': 'error', 'text': f'Backup failed: {error_msg}'})
-                self.queue.put({'type': 'log', 'text': f'Backup error: {error_msg}'})
+                self.queue_put({'type': 'error', 'text': f'Backup failed: {error_msg}'})
+                self.queue_put({'type': 'log', 'text': f'Backup error: {error_msg}'})
                 
         except Exception as e:
-            self.queue.put({'type': 'error', 'text': f'Error running backup: {str(e)}'})
-            self.queue.put({'type': 'log', 'text': f'Backup exception: {str(e)}'})
+            self.queue_put({'type': 'error', 'text': f'Error running backup: {str(e)}'})
+            self.queue_put({'type': 'log', 'text': f'Backup exception: {str(e)}'})
         finally:
             self.after(0, lambda: self.backup_btn.config(state='normal'))
     
@@ -743,7 +782,8 @@ class SocialBoostApp(tk.Tk):
                 [sys.executable, str(script_path)],
                 cwd=str(self.PROJECT_ROOT),
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                stderr=subprocess.PIPE,
+                env=self._child_env
             )
             
             self.running_processes['scheduler'] = process
@@ -752,12 +792,12 @@ class SocialBoostApp(tk.Tk):
             self.start_scheduler_btn.config(state='disabled')
             self.stop_scheduler_btn.config(state='normal')
             
-            self.queue.put({'type': 'success', 'text': 'Scheduler started successfully!'})
-            self.queue.put({'type': 'log', 'text': f'Scheduler started with PID: {process.pid}'})
+            self.queue_put({'type': 'success', 'text': 'Scheduler started successfully!'})
+            self.queue_put({'type': 'log', 'text': f'Scheduler started with PID: {process.pid}'})
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to start scheduler: {str(e)}")
-            self.queue.put({'type': 'log', 'text': f'Scheduler start error: {str(e)}'})
+            self.queue_put({'type': 'log', 'text': f'Scheduler start error: {str(e)}'})
     
     def stop_scheduler(self) -> None:
         """Stop the scheduler process."""
@@ -780,10 +820,10 @@ class SocialBoostApp(tk.Tk):
                     process.kill()
                     process.wait()
                 
-                self.queue.put({'type': 'success', 'text': 'Scheduler stopped successfully!'})
-                self.queue.put({'type': 'log', 'text': 'Scheduler stopped'})
+                self.queue_put({'type': 'success', 'text': 'Scheduler stopped successfully!'})
+                self.queue_put({'type': 'log', 'text': 'Scheduler stopped'})
             else:
-                self.queue.put({'type': 'log', 'text': 'Scheduler was not running'})
+                self.queue_put({'type': 'log', 'text': 'Scheduler was not running'})
             
             # Remove from tracking
             del self.running_processes['scheduler']
@@ -794,7 +834,7 @@ class SocialBoostApp(tk.Tk):
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to stop scheduler: {str(e)}")
-            self.queue.put({'type': 'log', 'text': f'Scheduler stop error: {str(e)}'})
+            self.queue_put({'type': 'log', 'text': f'Scheduler stop error: {str(e)}'})
             
     def load_logs(self) -> None:
         """Load log content from the log file."""
@@ -871,13 +911,34 @@ class SocialBoostApp(tk.Tk):
         self.after(5000, self.schedule_log_refresh)
     
     def add_log(self, message: str) -> None:
-        """Add a log message to the logs tab."""
+        """Add a log message to the logs tab (batched per idle cycle)."""
         if not hasattr(self, 'logs_text'):
             return
+        # Buffer the line and coalesce a burst of messages into a
+        # single widget edit on the next idle pass
+        self._log_buf.append(f"{message}\n")
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.after_idle(self._flush_logs)
+
+    def _flush_logs(self) -> None:
+        """Flush all buffered log lines into the widget in one edit."""
+        self._log_flush_scheduled = False
+        if not self._log_buf:
+            return
+        text = ''.join(self._log_buf)
+        self._log_buf.clear()
         self.logs_text.config(state='normal')
-        self.logs_text.insert(tk.END, f"{message}\n")
+        self.logs_text.insert(tk.END, text)
+        self._trim_text_widget(self.logs_text, self.MAX_LOG_LINES)
         self.logs_text.see(tk.END)
         self.logs_text.config(state='disabled')
+
+    def _trim_text_widget(self, widget: tk.Text, max_lines: int) -> None:
+        """Drop the oldest lines once a text widget exceeds max_lines."""
+        end_line = int(widget.index('end-1c').split('.')[0])
+        if end_line > max_lines:
+            widget.delete('1.0', f'{end_line - max_lines}.0')
         
     def run_generate_text(self) -> None:
         """Run the text generation script in a separate thread."""
@@ -900,7 +961,7 @@ class SocialBoostApp(tk.Tk):
                     videos = selected_data.get('videos', [])
                     selected_paths = images + videos
         except Exception as e:
-            self.queue.put({'type': 'error', 'text': f'Eroare la citirea selected_assets.json: {str(e)}'})
+            self.queue_put({'type': 'error', 'text': f'Eroare la citirea selected_assets.json: {str(e)}'})
             return
         
         # Check if any assets are selected
@@ -910,47 +971,72 @@ class SocialBoostApp(tk.Tk):
             
         # Disable button during execution
         self.generate_btn.config(state='disabled')
-        self.queue.put({'type': 'status', 'text': f'Se generează text pentru {len(selected_paths)} asset-uri...', 'color': 'blue'})
-        
-        # Run in separate thread
-        thread = threading.Thread(target=self._run_generate_text_thread, args=(prompt, selected_paths))
-        thread.daemon = True
-        thread.start()
+        self.queue_put({'type': 'status', 'text': f'Se generează text pentru {len(selected_paths)} asset-uri...', 'color': 'blue'})
         
-    def _run_generate_text_thread(self, prompt: str, selected_paths: List[str]) -> None:
-        """Thread function for running text generation."""
+        # Run on the background event loop
+        asyncio.run_coroutine_threadsafe(
+            self._run_generate_text_async(prompt, selected_paths), self._loop
+        )
+
+    async def _run_script(self, args: List[str]) -> 'tuple[int, str, str]':
+        """Run a child process on the background loop, streaming stdout.
+
+        Each stdout line is pushed into the queue as a log message while
+        the process runs, so output appears live instead of all at once.
+
+        Returns:
+            A (returncode, stdout, stderr) tuple.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(self.PROJECT_ROOT),
+            env=self._child_env
+        )
+
+        # Drain stderr concurrently so a chatty child cannot deadlock
+        stderr_task = asyncio.ensure_future(proc.stderr.read())
+
+        stdout_lines: List[str] = []
+        async for raw_line in proc.stdout:
+            line = raw_line.decode('utf-8', errors='replace').rstrip('\n')
+            stdout_lines.append(line)
+            self.queue_put({'type': 'log', 'text': line})
+
+        stderr_bytes = await stderr_task
+        returncode = await proc.wait()
+        return returncode, '\n'.join(stdout_lines), stderr_bytes.decode('utf-8', errors='replace')
+
+    async def _run_generate_text_async(self, prompt: str, selected_paths: List[str]) -> None:
+        """Coroutine for running text generation."""
         try:
             script_path = self.PROJECT_ROOT / "Automatizare_Completa" / "auto_generate.py"
-            
+
             if not script_path.exists():
-                self.queue.put({'type': 'error', 'text': f'Scriptul nu a fost găsit: {script_path}'})
+                self.queue_put({'type': 'error', 'text': f'Scriptul nu a fost găsit: {script_path}'})
                 return
-            
+
             # Build command arguments
             args = [sys.executable, str(script_path), "--prompt", prompt, "--assets"] + selected_paths
-            
+
             # Run the script
-            result = subprocess.run(
-                args,
-                capture_output=True,
-                text=True,
-                cwd=str(self.PROJECT_ROOT)
-            )
-            
-            if result.returncode == 0:
-                self.queue.put({'type': 'result', 'text': result.stdout})
-                self.queue.put({'type': 'success', 'text': f'Textul a fost generat cu succes pentru {len(selected_paths)} asset-uri!'})
-                self.queue.put({'type': 'log', 'text': f'Generare text completată pentru {len(selected_paths)} asset-uri cu prompt: {prompt[:50]}...'})
+            returncode, stdout, stderr = await self._run_script(args)
+
+            if returncode == 0:
+                self.queue_put({'type': 'result', 'text': stdout})
+                self.queue_put({'type': 'success', 'text': f'Textul a fost generat cu succes pentru {len(selected_paths)} asset-uri!'})
+                self.queue_put({'type': 'log', 'text': f'Generare text completată pentru {len(selected_paths)} asset-uri cu prompt: {prompt[:50]}...'})
             else:
-                error_msg = result.stderr or "Eroare necunoscută la generarea textului."
-                self.queue.put({'type': 'error', 'text': error_msg})
-                self.queue.put({'type': 'log', 'text': f'Eroare la generarea textului: {error_msg}'})
-                
+                error_msg = stderr or "Eroare necunoscută la generarea textului."
+                self.queue_put({'type': 'error', 'text': error_msg})
+                self.queue_put({'type': 'log', 'text': f'Eroare la generarea textului: {error_msg}'})
+
         except Exception as e:
-            self.queue.put({'type': 'error', 'text': f'Eroare la executarea scriptului: {str(e)}'})
-            self.queue.put({'type': 'log', 'text': f'Eroare critică: {str(e)}'})
+            self.queue_put({'type': 'error', 'text': f'Eroare la executarea scriptului: {str(e)}'})
+            self.queue_put({'type': 'log', 'text': f'Eroare critică: {str(e)}'})
         finally:
-            self.queue.put({'type': 'status', 'text': 'Ready', 'color': 'green'})
+            self.queue_put({'type': 'status', 'text': 'Ready', 'color': 'green'})
             self.after(0, lambda: self.generate_btn.config(state='normal'))
             
     def run_generate_text_test(self) -> None:
@@ -964,44 +1050,39 @@ class SocialBoostApp(tk.Tk):
         """Run the post text script in a separate thread."""
         # Disable button during execution
         self.test_post_btn.config(state='disabled')
-        self.queue.put({'type': 'status', 'text': 'Se postează textul...', 'color': 'blue'})
+        self.queue_put({'type': 'status', 'text': 'Se postează textul...', 'color': 'blue'})
         
-        # Run in separate thread
-        thread = threading.Thread(target=self._run_post_text_thread)
-        thread.daemon = True
-        thread.start()
-        
-    def _run_post_text_thread(self) -> None:
-        """Thread function for running text posting."""
+        # Run on the background event loop
+        asyncio.run_coroutine_threadsafe(self._run_post_text_async(), self._loop)
+
+    async def _run_post_text_async(self) -> None:
+        """Coroutine for running text posting."""
         try:
             script_path = self.PROJECT_ROOT / "Automatizare_Completa" / "auto_post.py"
-            
+
             if not script_path.exists():
-                self.queue.put({'type': 'error', 'text': f'Scriptul nu a fost găsit: {script_path}'})
+                self.queue_put({'type': 'error', 'text': f'Scriptul nu a fost găsit: {script_path}'})
                 return
-                
+
             # Run the script with test message
             test_message = "Mesaj test din GUI - SocialBoost Facebook AutoPoster v3"
-            result = subprocess.run(
-                [sys.executable, str(script_path), "--message", test_message],
-                capture_output=True,
-                text=True,
-                cwd=str(self.PROJECT_ROOT)
+            returncode, stdout, stderr = await self._run_script(
+                [sys.executable, str(script_path), "--message", test_message]
             )
-            
-            if result.returncode == 0:
-                self.queue.put({'type': 'success', 'text': 'Textul a fost postat cu succes pe Facebook!'})
-                self.queue.put({'type': 'log', 'text': f'Postare completată: {test_message}'})
+
+            if returncode == 0:
+                self.queue_put({'type': 'success', 'text': 'Textul a fost postat cu succes pe Facebook!'})
+                self.queue_put({'type': 'log', 'text': f'Postare completată: {test_message}'})
             else:
-                error_msg = result.stderr or "Eroare necunoscută la postarea textului."
-                self.queue.put({'type': 'error', 'text': error_msg})
-                self.queue.put({'type': 'log', 'text': f'Eroare la postarea textului: {error_msg}'})
-                
+                error_msg = stderr or "Eroare necunoscută la postarea textului."
+                self.queue_put({'type': 'error', 'text': error_msg})
+                self.queue_put({'type': 'log', 'text': f'Eroare la postarea textului: {error_msg}'})
+
         except Exception as e:
-            self.queue.put({'type': 'error', 'text': f'Eroare la executarea scriptului: {str(e)}'})
-            self.queue.put({'type': 'log', 'text': f'Eroare critică: {str(e)}'})
+            self.queue_put({'type': 'error', 'text': f'Eroare la executarea scriptului: {str(e)}'})
+            self.queue_put({'type': 'log', 'text': f'Eroare critică: {str(e)}'})
         finally:
-            self.queue.put({'type': 'status', 'text': 'Ready', 'color': 'green'})
+            self.queue_put({'type': 'status', 'text': 'Ready', 'color': 'green'})
             self.after(0, lambda: self.test_post_btn.config(state='normal'))
     
     def load_assets(self) -> None:
@@ -1164,7 +1245,7 @@ class SocialBoostApp(tk.Tk):
             
             # Disable button during execution
             self.post_selected_btn.config(state='disabled')
-            self.queue.put({'type': 'status', 'text': 'Se postează asset-urile selectate...', 'color': 'blue'})
+            self.queue_put({'type': 'status', 'text': 'Se postează asset-urile selectate...', 'color': 'blue'})
             
             # Run in separate thread
             thread = threading.Thread(target=self._run_post_selected_assets_thread)
@@ -1182,7 +1263,7 @@ class SocialBoostApp(tk.Tk):
             script_path = self.PROJECT_ROOT / "Automatizare_Completa" / "auto_post.py"
             
             if not script_path.exists():
-                self.queue.put({'type': 'error', 'text': f'Scriptul nu a fost găsit: {script_path}'})
+                self.queue_put({'type': 'error', 'text': f'Scriptul nu a fost găsit: {script_path}'})
                 return
             
             # Run the script with --selected-only flag
@@ -1190,25 +1271,26 @@ class SocialBoostApp(tk.Tk):
                 [sys.executable, str(script_path), "--selected-only"],
                 capture_output=True,
                 text=True,
-                cwd=str(self.PROJECT_ROOT)
+                cwd=str(self.PROJECT_ROOT),
+                env=self._child_env
             )
             
             if result.returncode == 0:
-                self.queue.put({'type': 'success', 'text': 'Asset-urile selectate au fost postate cu succes!'})
-                self.queue.put({'type': 'log', 'text': 'Postare asset-uri selectate completată'})
-                self.queue.put({'type': 'log', 'text': result.stdout})
+                self.queue_put({'type': 'success', 'text': 'Asset-urile selectate au fost postate cu succes!'})
+                self.queue_put({'type': 'log', 'text': 'Postare asset-uri selectate completată'})
+                self.queue_put({'type': 'log', 'text': result.stdout})
             else:
                 error_msg = result.stderr or "Eroare necunoscută la postarea asset-urilor."
-                self.queue.put({'type': 'error', 'text': error_msg})
-                self.queue.put({'type': 'log', 'text': f'Eroare la postarea asset-urilor: {error_msg}'})
+                self.queue_put({'type': 'error', 'text': error_msg})
+                self.queue_put({'type': 'log', 'text': f'Eroare la postarea asset-urilor: {error_msg}'})
                 if result.stdout:
-                    self.queue.put({'type': 'log', 'text': result.stdout})
+                    self.queue_put({'type': 'log', 'text': result.stdout})
                 
         except Exception as e:
-            self.queue.put({'type': 'error', 'text': f'Eroare la executarea scriptului: {str(e)}'})
-            self.queue.put({'type': 'log', 'text': f'Eroare critică: {str(e)}'})
+            self.queue_put({'type': 'error', 'text': f'Eroare la executarea scriptului: {str(e)}'})
+            self.queue_put({'type': 'log', 'text': f'Eroare critică: {str(e)}'})
         finally:
-            self.queue.put({'type': 'status', 'text': 'Ready', 'color': 'green'})
+            self.queue_put({'type': 'status', 'text': 'Ready', 'color': 'green'})
             self.after(0, lambda: self.post_selected_btn.config(state='normal'))
     
     def on_job_type_change(self, event: Any) -> None:
@@ -1450,7 +1532,8 @@ class SocialBoostApp(tk.Tk):
                     [sys.executable, str(script_path), "--check-only"],
                     capture_output=True,
                     text=True,
-                    cwd=str(self.PROJECT_ROOT)
+                    cwd=str(self.PROJECT_ROOT),
+                    env=self._child_env
                 )
                 
                 # Update status label based on exit code
@@ -13,41 +13,12 @@ from datetime import datetime
 from typing import Dict, Any, Optional, List
 import re
 
-class PromptGenerator:
-    """Generates structured prompts for AI assistants."""
-    
-    def __init__(self, templates_dir: Optional[Path] = None):
-        self.templates_dir = templates_dir or Path("Prompts/Templates")
-        self.prompts_dir = Path("Prompts/Generated")
-        self.prompts_dir.mkdir(parents=True, exist_ok=True)
-        
-        self.context_file = Path("Prompts/CURRENT_CONTEXT.md")
-        self.project_context_file = Path("PROJECT_CONTEXT.json")
-        
-        # Available templates
-        self.templates = {
-            "implementation": "implementation_template.md",
-            "debug": "debug_template.md",
-            "validation": "validation_template.md",
-            "refactor": "refactor_template.md",
-            "setup": "setup_template.md"
-        }
-    
-    def load_template(self, template_name: str) -> str:
-        """Load a template file."""
-        template_file = self.templates_dir / self.templates.get(template_name, template_name)
-        
-        if not template_file.exists():
-            # Return a basic template if file doesn't exist
-            return self.get_default_template(template_name)
-        
-        with open(template_file, 'r', encoding='utf-8') as f:
-            return f.read()
-    
-    def get_default_template(self, template_type: str) -> str:
-        """Get default template based on type."""
-        templates = {
-            "implementation": """# Implementation Task
+# Matches any {placeholder} left in a template; compiled once at import
+_PLACEHOLDER_RE = re.compile(r'\{[^}]+\}')
+
+# Built-in fallback templates, built once at import instead of per call
+_DEFAULT_TEMPLATES = {
+    "implementation": """# Implementation Task
 
 ## Objective
 {task_description}
@@ -79,7 +50,7 @@ class PromptGenerator:
 ## Additional Notes
 {additional_notes}
 """,
-            "debug": """# Debug Task
+    "debug": """# Debug Task
 
 ## Issue Description
 {issue_description}
@@ -109,7 +80,7 @@ class PromptGenerator:
 ## Resolution Criteria
 {resolution_criteria}
 """,
-            "validation": """# Validation Task
+    "validation": """# Validation Task
 
 ## Validation Scope
 {validation_scope}
@@ -136,7 +107,7 @@ class PromptGenerator:
 ## Report Format
 {report_format}
 """,
-            "refactor": """# Refactoring Task
+    "refactor": """# Refactoring Task
 
 ## Refactoring Goal
 {refactoring_goal}
@@ -167,7 +138,7 @@ class PromptGenerator:
 ## Success Metrics
 {success_metrics}
 """,
-            "setup": """# Setup Task
+    "setup": """# Setup Task
 
 ## Setup Objective
 {setup_objective}
@@ -190,9 +161,42 @@ class PromptGenerator:
 ## Success Criteria
 {success_criteria}
 """
+}
+
+class PromptGenerator:
+    """Generates structured prompts for AI assistants."""
+    
+    def __init__(self, templates_dir: Optional[Path] = None):
+        self.templates_dir = templates_dir or Path("Prompts/Templates")
+        self.prompts_dir = Path("Prompts/Generated")
+        self.prompts_dir.mkdir(parents=True, exist_ok=True)
+        
+        self.context_file = Path("Prompts/CURRENT_CONTEXT.md")
+        self.project_context_file = Path("PROJECT_CONTEXT.json")
+        
+        # Available templates
+        self.templates = {
+            "implementation": "implementation_template.md",
+            "debug": "debug_template.md",
+            "validation": "validation_template.md",
+            "refactor": "refactor_template.md",
+            "setup": "setup_template.md"
         }
+    
+    def load_template(self, template_name: str) -> str:
+        """Load a template file."""
+        template_file = self.templates_dir / self.templates.get(template_name, template_name)
+        
+        if not template_file.exists():
+            # Return a basic template if file doesn't exist
+            return self.get_default_template(template_name)
         
-        return templates.get(template_type, templates["implementation"])
+        with open(template_file, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    def get_default_template(self, template_type: str) -> str:
+        """Get default template based on type."""
+        return _DEFAULT_TEMPLATES.get(template_type, _DEFAULT_TEMPLATES["implementation"])
     
     def load_current_context(self) -> str:
         """Load current project context."""
@@ -242,17 +246,13 @@ class PromptGenerator:
         if variables:
             prompt_vars.update(variables)
         
-        # Fill in template
-        prompt = template
-        for key, value in prompt_vars.items():
-            placeholder = f"{{{key}}}"
-            if placeholder in prompt:
-                prompt = prompt.replace(placeholder, str(value))
-        
-        # Handle any remaining placeholders with empty string
-        prompt = re.sub(r'\{[^}]+\}', '', prompt)
-        
-        return prompt
+        # Fill in template in one pass; unknown placeholders become empty
+        # strings instead of requiring a second cleanup scan
+        def fill(match: "re.Match[str]") -> str:
+            value = prompt_vars.get(match.group(0)[1:-1])
+            return str(value) if value is not None else ""
+
+        return _PLACEHOLDER_RE.sub(fill, template)
     
     def save_prompt(self, prompt: str, filename: Optional[str] = None) -> Path:
         """Save generated prompt to file."""
@@ -4,12 +4,14 @@ Unit tests for Content Generation module
 """
 
 import pytest
+import asyncio
 import base64
+import json
 import tempfile
 import shutil
 import openai
 from pathlib import Path
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock, AsyncMock, mock_open
 from Automatizare_Completa.auto_generate import ContentGenerator
 
 class TestContentGenerator:
@@ -42,7 +44,9 @@ class TestContentGenerator:
         assert generator.api_key == "test-api-key"
         assert generator.model == "gpt-4o-mini"  # Default model
         assert generator.client == mock_client
-        mock_openai_class.assert_called_once_with(api_key="test-api-key")
+        mock_openai_class.assert_called_once()
+        assert mock_openai_class.call_args.kwargs['api_key'] == "test-api-key"
+        assert 'http_client' in mock_openai_class.call_args.kwargs
     
     @patch('Automatizare_Completa.auto_generate.openai.OpenAI')
     @patch.dict('os.environ', {'OPENAI_API_KEY': 'env-api-key', 'OPENAI_MODEL': 'gpt-4'})
@@ -172,6 +176,43 @@ class TestContentGenerator:
             assert messages[1]['content'][1]['type'] == "image_url"
             assert "data:image/png;base64,base64encodeddata" in messages[1]['content'][1]['image_url']['url']
     
+    @patch('Automatizare_Completa.auto_generate.openai.OpenAI')
+    @patch('builtins.open', create=True)
+    @patch('base64.b64encode')
+    @patch.dict('os.environ', {'OPENAI_VISION_FILE_UPLOAD': '1'})
+    def test_generate_caption_ignores_file_upload_flag(self, mock_b64encode, mock_open, mock_openai_class, temp_dir):
+        """Test that the retired upload flag no longer diverts captioning."""
+        # Arrange
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Generated caption"
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai_class.return_value = mock_client
+
+        mock_b64encode.return_value = b"base64encodeddata"
+        mock_open.return_value.__enter__.return_value.read.return_value = b"imagedata"
+
+        generator = ContentGenerator(api_key="test-key")
+        test_image_path = Path("test_image.png")
+
+        # Mock Path.exists and is_file
+        with patch.object(Path, 'exists', return_value=True), \
+             patch.object(Path, 'is_file', return_value=True), \
+             patch.object(Path, 'suffix', '.png'):
+
+            # Act
+            result = generator.generate_caption_for_image(test_image_path, "Test context")
+
+            # Assert - the Chat API ran with a base64 image part and the
+            # Files API was never touched
+            assert result == "Generated caption"
+            mock_client.files.create.assert_not_called()
+            mock_client.chat.completions.create.assert_called_once()
+            messages = mock_client.chat.completions.create.call_args[1]['messages']
+            assert messages[1]['content'][1]['type'] == "image_url"
+            assert "base64encodeddata" in messages[1]['content'][1]['image_url']['url']
+
     @patch('Automatizare_Completa.auto_generate.openai.OpenAI')
     def test_generate_caption_for_image_file_not_found(self, mock_openai_class, temp_dir):
         """Test image caption generation with file not found."""
@@ -494,6 +535,225 @@ class TestContentGenerator:
             assert result_vid == "Video post"
             mock_text.assert_called_once_with("test prompt related to video file test.mp4")
     
+    @patch('Automatizare_Completa.auto_generate.openai.AsyncOpenAI')
+    @patch('Automatizare_Completa.auto_generate.openai.OpenAI')
+    def test_generate_many_success(self, mock_openai_class, mock_async_openai_class, temp_dir):
+        """Test concurrent bulk generation via generate_many."""
+        # Arrange
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+
+        mock_aclient = MagicMock()
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Generated post text"
+        mock_aclient.chat.completions.create = AsyncMock(return_value=mock_response)
+        mock_async_openai_class.return_value = mock_aclient
+
+        generator = ContentGenerator(api_key="test-key")
+
+        # Act
+        results = asyncio.run(generator.generate_many(["Prompt 1", "Prompt 2", "Prompt 3"]))
+
+        # Assert
+        assert results == ["Generated post text"] * 3
+        assert mock_aclient.chat.completions.create.call_count == 3
+
+    @patch('Automatizare_Completa.auto_generate.openai.AsyncOpenAI')
+    @patch('Automatizare_Completa.auto_generate.openai.OpenAI')
+    def test_generate_many_partial_failure(self, mock_openai_class, mock_async_openai_class, temp_dir):
+        """Test that generate_many falls back per-prompt on failures."""
+        # Arrange
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+
+        mock_aclient = MagicMock()
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Generated post text"
+        mock_aclient.chat.completions.create = AsyncMock(
+            side_effect=[mock_response, Exception("API Error")]
+        )
+        mock_async_openai_class.return_value = mock_aclient
+
+        generator = ContentGenerator(api_key="test-key")
+
+        # Act
+        results = asyncio.run(generator.generate_many(["Prompt 1", "Prompt 2"]))
+
+        # Assert
+        assert results[0] == "Generated post text"
+        assert "✨ Something wonderful is brewing" in results[1]
+
+    @patch('Automatizare_Completa.auto_generate.asyncio.sleep', new_callable=AsyncMock)
+    @patch('Automatizare_Completa.auto_generate.openai.AsyncOpenAI')
+    @patch('Automatizare_Completa.auto_generate.openai.OpenAI')
+    def test_async_backoff_retries_without_blocking(self, mock_openai_class, mock_async_openai_class, mock_async_sleep, temp_dir):
+        """Test that the async path retries via asyncio.sleep, not time.sleep."""
+        # Arrange
+        import httpx
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+
+        mock_aclient = MagicMock()
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Generated post text"
+        timeout_error = openai.APITimeoutError(request=httpx.Request("POST", "https://api.openai.com"))
+        mock_aclient.chat.completions.create = AsyncMock(
+            side_effect=[timeout_error, mock_response]
+        )
+        mock_async_openai_class.return_value = mock_aclient
+
+        generator = ContentGenerator(api_key="test-key")
+
+        # Act
+        with patch('Automatizare_Completa.auto_generate.time.sleep') as mock_time_sleep:
+            result = asyncio.run(generator.agenerate_post_text("Test prompt"))
+
+        # Assert
+        assert result == "Generated post text"
+        assert mock_aclient.chat.completions.create.call_count == 2
+        mock_async_sleep.assert_awaited_once()
+        mock_time_sleep.assert_not_called()
+
+    def test_semantic_cache_hit_above_threshold(self):
+        """Test that a sufficiently similar prompt returns the cached response."""
+        from Automatizare_Completa.auto_generate import _SemanticCache
+        import numpy as np
+
+        cache = _SemanticCache(threshold=0.9)
+        vectors = {
+            "Write a post about productivity": np.array([1.0, 0.0]),
+            "Create a productivity post": np.array([0.99, 0.141]),
+            "Share a recipe for pancakes": np.array([0.0, 1.0])
+        }
+        with patch.object(cache, '_encode', side_effect=lambda p: vectors[p]):
+            cache.put("Write a post about productivity", "Cached productivity post")
+
+            assert cache.get("Create a productivity post") == "Cached productivity post"
+            assert cache.get("Share a recipe for pancakes") is None
+
+    def test_semantic_cache_disabled_without_dependency(self):
+        """Test that the cache degrades to a no-op when the embedder is unavailable."""
+        from Automatizare_Completa.auto_generate import _SemanticCache
+
+        cache = _SemanticCache()
+        with patch.object(cache, '_encode', return_value=None):
+            cache.put("Prompt", "Response")
+            assert cache.get("Prompt") is None
+
+    @patch('Automatizare_Completa.auto_generate.openai.OpenAI')
+    def test_stream_post_text(self, mock_openai_class, temp_dir):
+        """Test streaming text generation yields deltas incrementally."""
+        # Arrange
+        mock_client = MagicMock()
+
+        def make_chunk(content):
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = content
+            return chunk
+
+        mock_client.chat.completions.create.return_value = iter(
+            [make_chunk("Hello"), make_chunk(" world"), make_chunk(None)]
+        )
+        mock_openai_class.return_value = mock_client
+
+        generator = ContentGenerator(api_key="test-key")
+
+        # Act
+        parts = list(generator.stream_post_text("Test prompt"))
+
+        # Assert
+        assert "".join(parts) == "Hello world"
+        call_args = mock_client.chat.completions.create.call_args
+        assert call_args[1]['stream'] is True
+
+    @patch('Automatizare_Completa.auto_generate.openai.OpenAI')
+    def test_generate_variations_single_call(self, mock_openai_class, temp_dir):
+        """Test that N variations come from one structured-output call."""
+        # Arrange
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = json.dumps(
+            {"items": ["Variation 1", "Variation 2", "Variation 3"]}
+        )
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai_class.return_value = mock_client
+
+        generator = ContentGenerator(api_key="test-key")
+
+        # Act
+        result = generator.generate_variations("Base post", count=3)
+
+        # Assert
+        assert result == ["Variation 1", "Variation 2", "Variation 3"]
+        mock_client.chat.completions.create.assert_called_once()
+        call_args = mock_client.chat.completions.create.call_args
+        assert call_args[1]['response_format']['type'] == "json_schema"
+
+    @patch('Automatizare_Completa.auto_generate.openai.OpenAI')
+    def test_generate_variations_api_error(self, mock_openai_class, temp_dir):
+        """Test that variation generation falls back per item on failure."""
+        # Arrange
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.side_effect = Exception("API Error")
+        mock_openai_class.return_value = mock_client
+
+        generator = ContentGenerator(api_key="test-key")
+
+        # Act
+        result = generator.generate_variations("Base post", count=2)
+
+        # Assert
+        assert len(result) == 2
+        assert all("✨ Something wonderful is brewing" in text for text in result)
+
+    @patch('Automatizare_Completa.auto_generate.openai.OpenAI')
+    def test_generate_batch_success(self, mock_openai_class, temp_dir):
+        """Test bulk generation through the Batch API."""
+        # Arrange
+        mock_client = MagicMock()
+        mock_client.files.create.return_value = MagicMock(id="file-123")
+
+        mock_batch = MagicMock()
+        mock_batch.id = "batch-123"
+        mock_batch.status = "completed"
+        mock_batch.output_file_id = "file-456"
+        mock_client.batches.create.return_value = mock_batch
+
+        mock_output = MagicMock()
+        mock_output.text = "\n".join([
+            json.dumps({
+                "custom_id": "post-0",
+                "response": {"status_code": 200, "body": {"choices": [{"message": {"content": "Batch text 1"}}]}}
+            }),
+            json.dumps({
+                "custom_id": "post-1",
+                "response": {"status_code": 400, "body": {}},
+                "error": {"message": "Bad request"}
+            })
+        ])
+        mock_client.files.content.return_value = mock_output
+        mock_openai_class.return_value = mock_client
+
+        generator = ContentGenerator(api_key="test-key")
+
+        # Act
+        results = generator.generate_batch(["Prompt 1", "Prompt 2"])
+
+        # Assert
+        assert results["post-0"] == "Batch text 1"
+        assert "✨ Something wonderful is brewing" in results["post-1"]
+        mock_client.files.create.assert_called_once()
+        mock_client.batches.create.assert_called_once_with(
+            input_file_id="file-123",
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
     @patch('Automatizare_Completa.auto_generate.openai.OpenAI')
     def test_file_extension_detection(self, mock_openai_class, temp_dir):
         """Test file extension detection for different media types."""
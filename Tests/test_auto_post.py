@@ -4,11 +4,13 @@ Unit tests for Facebook Auto Post module
 """
 
 import pytest
+import asyncio
 import os
 import json
+import time
 from pathlib import Path
-from unittest.mock import patch, MagicMock
-from Automatizare_Completa.auto_post import FacebookAutoPost, get_assets_to_post, load_asset_tracking, save_asset_tracking
+from unittest.mock import patch, MagicMock, AsyncMock
+from Automatizare_Completa.auto_post import FacebookAutoPost, AsyncFacebookAutoPost, run_many, get_assets_to_post, load_asset_tracking, save_asset_tracking
 
 class TestFacebookAutoPost:
     """Test cases for FacebookAutoPost class."""
@@ -53,7 +55,7 @@ class TestFacebookAutoPost:
                 with pytest.raises(ValueError, match="Facebook credentials not properly configured"):
                     FacebookAutoPost()
     
-    @patch('Automatizare_Completa.auto_post.requests.post')
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
     def test_post_text_success(self, mock_post, poster):
         """Test successful text posting."""
         # Arrange
@@ -71,13 +73,33 @@ class TestFacebookAutoPost:
         expected_url = "https://graph.facebook.com/v18.0/mock_page_67890/feed"
         expected_params = {'message': test_message, 'access_token': 'mock_token_12345'}
         
-        mock_post.assert_called_once_with(expected_url, params=expected_params, timeout=30)
+        mock_post.assert_called_once_with(expected_url, params=expected_params, timeout=(5, 30))
         
         assert result['status'] == 'success'
         assert result['post_id'] == '12345_67890'
         assert result['message'] == 'Post created successfully'
     
-    @patch('Automatizare_Completa.auto_post.requests.post')
+    @patch('Automatizare_Completa.auto_post.time.sleep')
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
+    def test_post_text_high_usage_pauses(self, mock_post, mock_sleep, poster):
+        """Test that high X-App-Usage triggers a preemptive pause."""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'id': '12345_67890'}
+        mock_response.headers = {'X-App-Usage': '{"call_count": 95, "total_time": 10, "total_cputime": 5}'}
+        mock_post.return_value = mock_response
+
+        # Act
+        result = poster.post_text("Hello World")
+
+        # Assert
+        assert result['status'] == 'success'
+        assert poster.usage['call_count'] == 95
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] >= 60.0
+
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
     def test_post_text_api_error(self, mock_post, poster):
         """Test text posting with API error."""
         # Arrange
@@ -97,7 +119,7 @@ class TestFacebookAutoPost:
         assert result['error'] == 'Invalid token'
         assert result['status_code'] == 400
     
-    @patch('Automatizare_Completa.auto_post.requests.post')
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
     def test_post_text_network_error(self, mock_post, poster):
         """Test text posting with network error."""
         # Arrange
@@ -112,7 +134,7 @@ class TestFacebookAutoPost:
         assert result['status'] == 'failed'
         assert 'Network error' in result['error']
     
-    @patch('Automatizare_Completa.auto_post.requests.post')
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
     def test_post_text_timeout(self, mock_post, poster):
         """Test text posting with timeout."""
         # Arrange
@@ -163,10 +185,11 @@ class TestFacebookAutoPost:
                 with pytest.raises(ValueError, match="Facebook credentials not properly configured"):
                     FacebookAutoPost()
     
-    @patch('Automatizare_Completa.auto_post.requests.post')
+    @patch('Automatizare_Completa.auto_post.MultipartEncoder', None)
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
     @patch('builtins.open', create=True)
     def test_post_image_success(self, mock_open, mock_post, poster):
-        """Test successful image posting."""
+        """Test successful image posting through the fallback files= path."""
         # Arrange
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -190,13 +213,13 @@ class TestFacebookAutoPost:
             # Assert
             expected_url = "https://graph.facebook.com/v18.0/mock_page_67890/photos"
             expected_data = {'message': test_message, 'access_token': 'mock_token_12345'}
-            expected_files = {'source': mock_file}
+            expected_files = {'source': (test_image_path.name, mock_file, 'image/jpeg')}
             
             mock_post.assert_called_once_with(
                 expected_url, 
                 data=expected_data, 
                 files=expected_files, 
-                timeout=120
+                timeout=(5, 120)
             )
             
             assert result['status'] == 'success'
@@ -204,6 +227,51 @@ class TestFacebookAutoPost:
             assert result['message'] == 'Image post created successfully'
             assert result['image_path'] == str(test_image_path)
     
+    @patch('Automatizare_Completa.auto_post.MultipartEncoder')
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
+    @patch('builtins.open', create=True)
+    def test_post_image_success_multipart_encoder(self, mock_open, mock_post, mock_encoder_cls, poster):
+        """Test image posting through the streaming MultipartEncoder branch."""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'id': '12345_67890'}
+        mock_post.return_value = mock_response
+
+        mock_encoder = MagicMock()
+        mock_encoder.content_type = 'multipart/form-data; boundary=test'
+        mock_encoder_cls.return_value = mock_encoder
+
+        mock_file = MagicMock()
+        mock_open.return_value.__enter__.return_value = mock_file
+
+        test_message = "Hello World"
+        test_image_path = Path("test_image.png")
+
+        # Mock Path.exists and is_file
+        with patch.object(Path, 'exists', return_value=True), \
+             patch.object(Path, 'is_file', return_value=True), \
+             patch.object(Path, 'suffix', '.png'):
+
+            # Act
+            result = poster.post_image(test_message, test_image_path)
+
+            # Assert - the encoder body is sent with its own content type
+            expected_url = "https://graph.facebook.com/v18.0/mock_page_67890/photos"
+            fields = mock_encoder_cls.call_args.kwargs['fields']
+            assert fields['message'] == test_message
+            assert fields['source'][0] == test_image_path.name
+
+            mock_post.assert_called_once_with(
+                expected_url,
+                data=mock_encoder,
+                headers={'Content-Type': 'multipart/form-data; boundary=test'},
+                timeout=(5, 120)
+            )
+
+            assert result['status'] == 'success'
+            assert result['post_id'] == '12345_67890'
+
     def test_post_image_file_not_found(self, poster):
         """Test image posting with file not found."""
         # Arrange
@@ -255,7 +323,8 @@ class TestFacebookAutoPost:
             assert result['status'] == 'failed'
             assert result['error'] == 'Unsupported image format: .xyz'
     
-    @patch('Automatizare_Completa.auto_post.requests.post')
+    @patch('Automatizare_Completa.auto_post.MultipartEncoder', None)
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
     @patch('builtins.open', create=True)
     def test_post_image_api_error(self, mock_open, mock_post, poster):
         """Test image posting with API error."""
@@ -286,9 +355,11 @@ class TestFacebookAutoPost:
             assert result['status_code'] == 400
             assert result['image_path'] == str(test_image_path)
     
-    @patch('Automatizare_Completa.auto_post.requests.post')
+    @patch('Automatizare_Completa.auto_post.MultipartEncoder', None)
+    @patch('Automatizare_Completa.auto_post.time.sleep')
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
     @patch('builtins.open', create=True)
-    def test_post_image_timeout(self, mock_open, mock_post, poster):
+    def test_post_image_timeout(self, mock_open, mock_post, mock_sleep, poster):
         """Test image posting with timeout."""
         # Arrange
         from requests.exceptions import Timeout
@@ -330,8 +401,8 @@ class TestFacebookAutoPost:
             assert result['status'] == 'failed'
             assert result['error'] == 'Message cannot be empty'
     
-    @patch('Automatizare_Completa.auto_post.requests.post')
-    @patch('Automatizare_Completa.auto_post.requests.get')
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
+    @patch('Automatizare_Completa.auto_post.requests.Session.get')
     @patch('builtins.open', create=True)
     def test_post_video_success(self, mock_open, mock_get, mock_post, poster):
         """Test successful video posting."""
@@ -388,6 +459,52 @@ class TestFacebookAutoPost:
             assert result['video_path'] == str(test_video_path)
             assert result['file_size'] == 2048
     
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
+    @patch('Automatizare_Completa.auto_post.requests.Session.get')
+    def test_post_video_mmap_path(self, mock_get, mock_post, poster, tmp_path):
+        """Test video posting through the real mmap chunk path."""
+        # Arrange - a real temp file so mmap.mmap succeeds and the upload
+        # must release its chunk views before closing the map
+        test_video_path = tmp_path / "test_video.mp4"
+        test_video_path.write_bytes(b"\x00\x01\x02\x03" * 2048)
+        file_size = test_video_path.stat().st_size
+
+        # Mock start upload response
+        start_response = MagicMock()
+        start_response.status_code = 200
+        start_response.json.return_value = {
+            'video_id': '12345_67890',
+            'upload_session_id': 'session_123',
+            'start_offset': 0
+        }
+
+        # Mock transfer response (whole file accepted in one chunk)
+        transfer_response = MagicMock()
+        transfer_response.status_code = 200
+        transfer_response.json.return_value = {'start_offset': file_size}
+
+        # Mock finish response
+        finish_response = MagicMock()
+        finish_response.status_code = 200
+        finish_response.json.return_value = {'success': True}
+
+        # Mock status check response
+        status_response = MagicMock()
+        status_response.status_code = 200
+        status_response.json.return_value = {'status': 'ready'}
+
+        mock_post.side_effect = [start_response, transfer_response, finish_response]
+        mock_get.return_value = status_response
+
+        # Act
+        result = poster.post_video("Hello World", test_video_path)
+
+        # Assert - the finish phase ran and the upload succeeded
+        assert result['status'] == 'success'
+        assert result['video_id'] == '12345_67890'
+        assert result['file_size'] == file_size
+        assert mock_post.call_count == 3
+
     def test_post_video_file_not_found(self, poster):
         """Test video posting with file not found."""
         # Arrange
@@ -421,7 +538,7 @@ class TestFacebookAutoPost:
             assert result['status'] == 'failed'
             assert result['error'] == 'Unsupported video format: .txt'
     
-    @patch('Automatizare_Completa.auto_post.requests.post')
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
     @patch('builtins.open', create=True)
     def test_post_video_api_error_start(self, mock_open, mock_post, poster):
         """Test video posting with API error at start phase."""
@@ -456,7 +573,7 @@ class TestFacebookAutoPost:
             assert 'Start upload failed' in result['error']
             assert 'Invalid video format' in result['error']
     
-    @patch('Automatizare_Completa.auto_post.requests.post')
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
     @patch('builtins.open', create=True)
     def test_post_video_api_error_transfer(self, mock_open, mock_post, poster):
         """Test video posting with API error at transfer phase."""
@@ -520,10 +637,297 @@ class TestFacebookAutoPost:
             assert result['status'] == 'failed'
             assert result['error'] == 'Message cannot be empty'
 
+class TestImageBulkhead:
+    """Test cases for the image upload bulkhead."""
+
+    @pytest.fixture
+    def poster(self):
+        """Create FacebookAutoPost instance with mocked credentials."""
+        with patch('Automatizare_Completa.auto_post.FACEBOOK_PAGE_TOKEN', 'mock_token_12345'), \
+             patch('Automatizare_Completa.auto_post.FACEBOOK_PAGE_ID', 'mock_page_67890'), \
+             patch('Automatizare_Completa.auto_post.FACEBOOK_APP_ID', 'mock_app_11111'):
+            return FacebookAutoPost()
+
+    def test_post_image_rejected_when_saturated(self, poster):
+        """Test that a saturated bulkhead rejects instead of queueing."""
+        # Arrange
+        poster._image_sem = MagicMock()
+        poster._image_sem.acquire.return_value = False
+
+        with patch.object(Path, 'exists', return_value=True), \
+             patch.object(Path, 'is_file', return_value=True), \
+             patch.object(Path, 'suffix', '.png'), \
+             patch('Automatizare_Completa.auto_post._detect_image', return_value='image/png'):
+
+            # Act
+            result = poster.post_image("Hello World", Path("test_image.png"))
+
+        # Assert
+        assert result['status'] == 'failed'
+        assert result['error'] == 'bulkhead_full'
+        poster._image_sem.release.assert_not_called()
+
+class TestCircuitBreaker:
+    """Test cases for the Graph API circuit breaker."""
+
+    @pytest.fixture
+    def poster(self):
+        """Create FacebookAutoPost instance with mocked credentials."""
+        with patch('Automatizare_Completa.auto_post.FACEBOOK_PAGE_TOKEN', 'mock_token_12345'), \
+             patch('Automatizare_Completa.auto_post.FACEBOOK_PAGE_ID', 'mock_page_67890'), \
+             patch('Automatizare_Completa.auto_post.FACEBOOK_APP_ID', 'mock_app_11111'):
+            return FacebookAutoPost()
+
+    @patch('Automatizare_Completa.auto_post.time.sleep')
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
+    def test_breaker_opens_after_consecutive_failures(self, mock_post, mock_sleep, poster):
+        """Test that repeated connection errors trip the feed breaker."""
+        # Arrange
+        from requests.exceptions import ConnectionError
+        mock_post.side_effect = ConnectionError("down")
+
+        # Act - two posts x three attempts = six failures (threshold is five)
+        poster.post_text("One")
+        poster.post_text("Two")
+        calls_before = mock_post.call_count
+        result = poster.post_text("Three")
+
+        # Assert - third post fails fast without touching the network
+        assert poster._breakers['feed'].state == 'open'
+        assert result['status'] == 'failed'
+        assert result['error'] == 'circuit_open'
+        assert mock_post.call_count == calls_before
+
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
+    def test_breaker_half_open_probe_recovers(self, mock_post, poster):
+        """Test that a successful probe closes the breaker after recovery."""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'id': '12345_67890'}
+        mock_post.return_value = mock_response
+
+        breaker = poster._breakers['feed']
+        for _ in range(5):
+            breaker.record_failure()
+        assert breaker.state == 'open'
+        breaker._opened_at -= breaker.recovery + 1  # simulate the cool-down elapsing
+
+        # Act
+        result = poster.post_text("Hello World")
+
+        # Assert
+        assert result['status'] == 'success'
+        assert breaker.state == 'closed'
+
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
+    def test_open_videos_breaker_fails_fast(self, mock_post, poster, tmp_path):
+        """Test that an open videos breaker skips the upload entirely."""
+        # Arrange
+        video_path = tmp_path / "test_video.mp4"
+        video_path.write_bytes(b"fake video data")
+
+        breaker = poster._breakers['videos']
+        for _ in range(5):
+            breaker.record_failure()
+        assert breaker.state == 'open'
+
+        # Act
+        result = poster.post_video("Test message", video_path)
+
+        # Assert - fails fast without touching the network
+        assert result['status'] == 'failed'
+        assert result['error'] == 'circuit_open'
+        mock_post.assert_not_called()
+
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
+    def test_videos_breaker_counts_start_failure(self, mock_post, poster, tmp_path):
+        """Test that a failed start phase registers on the videos breaker."""
+        # Arrange
+        video_path = tmp_path / "test_video.mp4"
+        video_path.write_bytes(b"fake video data")
+
+        mock_response = MagicMock()
+        mock_response.status_code = 400
+        mock_response.json.return_value = {'error': {'message': 'Invalid session'}}
+        mock_post.return_value = mock_response
+
+        # Act
+        result = poster.post_video("Test message", video_path)
+
+        # Assert
+        assert result['status'] == 'failed'
+        assert poster._breakers['videos']._failures == 1
+
+class TestPostBatch:
+    """Test cases for batched Graph API posting."""
+
+    @pytest.fixture
+    def poster(self):
+        """Create FacebookAutoPost instance with mocked credentials."""
+        with patch('Automatizare_Completa.auto_post.FACEBOOK_PAGE_TOKEN', 'mock_token_12345'), \
+             patch('Automatizare_Completa.auto_post.FACEBOOK_PAGE_ID', 'mock_page_67890'), \
+             patch('Automatizare_Completa.auto_post.FACEBOOK_APP_ID', 'mock_app_11111'):
+            return FacebookAutoPost()
+
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
+    def test_post_batch_single_request(self, mock_post, poster):
+        """Test that a small batch goes out as one HTTP request."""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = [
+            {'code': 200, 'body': '{"id": "1_1"}'},
+            {'code': 200, 'body': '{"id": "1_2"}'},
+        ]
+        mock_post.return_value = mock_response
+
+        # Act
+        results = poster.post_batch(["One", "Two"])
+
+        # Assert
+        assert mock_post.call_count == 1
+        assert [r['post_id'] for r in results] == ['1_1', '1_2']
+        sent_batch = json.loads(mock_post.call_args.kwargs['data']['batch'])
+        assert len(sent_batch) == 2
+        assert sent_batch[0]['relative_url'] == 'mock_page_67890/feed'
+
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
+    def test_post_batch_mixed_results(self, mock_post, poster):
+        """Test per-item errors and preflight validation in a batch."""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = [
+            {'code': 200, 'body': '{"id": "1_1"}'},
+            {'code': 400, 'body': '{"error": {"message": "Invalid parameter"}}'},
+        ]
+        mock_post.return_value = mock_response
+
+        # Act
+        results = poster.post_batch(["One", "", "Two"])
+
+        # Assert
+        assert results[0]['status'] == 'success'
+        assert results[1]['error'] == 'Message cannot be empty'
+        assert results[2]['status'] == 'failed'
+        assert results[2]['error'] == 'Invalid parameter'
+        assert mock_post.call_count == 1
+
+class TestDeadline:
+    """Test cases for end-to-end deadline propagation."""
+
+    @pytest.fixture
+    def poster(self):
+        """Create FacebookAutoPost instance with mocked credentials."""
+        with patch('Automatizare_Completa.auto_post.FACEBOOK_PAGE_TOKEN', 'mock_token_12345'), \
+             patch('Automatizare_Completa.auto_post.FACEBOOK_PAGE_ID', 'mock_page_67890'), \
+             patch('Automatizare_Completa.auto_post.FACEBOOK_APP_ID', 'mock_app_11111'):
+            return FacebookAutoPost()
+
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
+    def test_expired_deadline_skips_network(self, mock_post, poster):
+        """Test that a spent deadline fails fast without an API call."""
+        # Act
+        result = poster.post_text("Hello World", deadline=time.monotonic() - 1)
+
+        # Assert
+        assert result['status'] == 'failed'
+        assert result['error'] == 'deadline_exceeded'
+        mock_post.assert_not_called()
+
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
+    def test_timeout_clamped_to_budget(self, mock_post, poster):
+        """Test that the per-attempt timeout shrinks to the remaining budget."""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'id': '123456789_987654321'}
+        mock_post.return_value = mock_response
+
+        # Act
+        result = poster.post_text("Hello World", deadline=time.monotonic() + 10)
+
+        # Assert
+        assert result['status'] == 'success'
+        connect_timeout, read_timeout = mock_post.call_args.kwargs['timeout']
+        assert connect_timeout == 5
+        assert read_timeout <= 10
+
+class TestAsyncFacebookAutoPost:
+    """Test cases for AsyncFacebookAutoPost class."""
+
+    @pytest.fixture
+    def aposter(self):
+        """Create AsyncFacebookAutoPost instance with mocked credentials."""
+        with patch('Automatizare_Completa.auto_post.FACEBOOK_PAGE_TOKEN', 'mock_token_12345'), \
+             patch('Automatizare_Completa.auto_post.FACEBOOK_PAGE_ID', 'mock_page_67890'), \
+             patch('Automatizare_Completa.auto_post.FACEBOOK_APP_ID', 'mock_app_11111'):
+            return AsyncFacebookAutoPost()
+
+    @patch('Automatizare_Completa.auto_post.httpx.AsyncClient.post', new_callable=AsyncMock)
+    def test_post_many_concurrent_success(self, mock_post, aposter):
+        """Test posting several messages concurrently."""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'id': '12345_67890'}
+        mock_post.return_value = mock_response
+
+        # Act
+        results = asyncio.run(aposter.post_many(["One", "Two", "Three"]))
+
+        # Assert
+        assert len(results) == 3
+        assert all(r['status'] == 'success' for r in results)
+        assert mock_post.await_count == 3
+
+    @patch('Automatizare_Completa.auto_post.httpx.AsyncClient.post', new_callable=AsyncMock)
+    def test_async_post_text_api_error(self, mock_post, aposter):
+        """Test async text posting with API error."""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 400
+        mock_response.json.return_value = {'error': {'message': 'Invalid token'}}
+        mock_post.return_value = mock_response
+
+        # Act
+        result = asyncio.run(aposter.post_text("Hello World"))
+
+        # Assert
+        assert result['status'] == 'failed'
+        assert result['error'] == 'Invalid token'
+        assert result['status_code'] == 400
+
+    def test_async_post_text_empty_message(self, aposter):
+        """Test async posting of an empty message."""
+        # Act
+        result = asyncio.run(aposter.post_text(""))
+
+        # Assert
+        assert result['status'] == 'failed'
+        assert result['error'] == 'Message cannot be empty'
+
+    @patch('Automatizare_Completa.auto_post.httpx.AsyncClient.post', new_callable=AsyncMock)
+    def test_run_many_from_sync_code(self, mock_post, aposter):
+        """Test the sync bridge running several coroutines concurrently."""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'id': '12345_67890'}
+        mock_post.return_value = mock_response
+
+        # Act
+        results = run_many([aposter.post_text("One"), aposter.post_text("Two")])
+
+        # Assert
+        assert [r['status'] for r in results] == ['success', 'success']
+        assert mock_post.await_count == 2
+
 class TestFacebookAutoPostIntegration:
     """Integration tests for FacebookAutoPost."""
     
-    @patch('Automatizare_Completa.auto_post.requests.post')
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
     def test_full_post_workflow(self, mock_post):
         """Test complete posting workflow."""
         # Arrange
@@ -558,9 +962,9 @@ class TestFacebookAutoPostIntegration:
                 assert call_args[0][0] == "https://graph.facebook.com/v18.0/test_page/feed"
                 assert call_args[1]['params']['message'] == "Integration test message"
                 assert call_args[1]['params']['access_token'] == "test_token"
-                assert call_args[1]['timeout'] == 30
+                assert call_args[1]['timeout'] == (5, 30)
 
-    @patch('Automatizare_Completa.auto_post.requests.post')
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
     @patch('Automatizare_Completa.auto_post.time.sleep')
     def test_post_text_retry_success(self, mock_sleep, mock_post):
         """Test that post_text retries on retryable errors and succeeds."""
@@ -594,9 +998,9 @@ class TestFacebookAutoPostIntegration:
                 assert result["status"] == "success"
                 assert result["post_id"] == "post_123"
                 assert mock_post.call_count == 2
-                mock_sleep.assert_called_once_with(1)  # 2^0 = 1 second wait
+                mock_sleep.assert_called_once()  # jittered backoff delay
     
-    @patch('Automatizare_Completa.auto_post.requests.post')
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
     @patch('Automatizare_Completa.auto_post.time.sleep')
     def test_post_text_retry_max_attempts(self, mock_sleep, mock_post):
         """Test that post_text fails after max retries."""
@@ -626,7 +1030,7 @@ class TestFacebookAutoPostIntegration:
                 assert mock_post.call_count == 3
                 assert mock_sleep.call_count == 2  # 2 retries
     
-    @patch('Automatizare_Completa.auto_post.requests.post')
+    @patch('Automatizare_Completa.auto_post.requests.Session.post')
     @patch('Automatizare_Completa.auto_post.time.sleep')
     def test_post_text_connection_error_retry(self, mock_sleep, mock_post):
         """Test that post_text retries on connection errors."""
@@ -657,7 +1061,7 @@ class TestFacebookAutoPostIntegration:
                 assert result["status"] == "success"
                 assert result["post_id"] == "post_123"
                 assert mock_post.call_count == 2
-                mock_sleep.assert_called_once_with(1)  # 2^0 = 1 second wait
+                mock_sleep.assert_called_once()  # jittered backoff delay
 
 
 class TestAssetSelection:
@@ -44,7 +44,7 @@ class TestEndToEndWorkflow:
         
         # Test asset path
         test_image = temp_dir / "Assets" / "Images" / "test_image.png"
-        test_image.write_bytes(b"fake image data")
+        test_image.write_bytes(b"\x89PNG\r\n\x1a\nfake image data")
         
         with patch.dict('os.environ', mock_env_vars, clear=True):
             # Test 1: FacebookAutoPost initialization
@@ -78,7 +78,7 @@ class TestEndToEndWorkflow:
         """Test complete workflow with mocked Facebook posting."""
         
         test_image = temp_dir / "Assets" / "Images" / "test_image.png"
-        test_image.write_bytes(b"fake image data")
+        test_image.write_bytes(b"\x89PNG\r\n\x1a\nfake image data")
         
         with patch.dict('os.environ', mock_env_vars, clear=True):
             from Automatizare_Completa.auto_post import FacebookAutoPost
@@ -86,21 +86,22 @@ class TestEndToEndWorkflow:
             with patch('Automatizare_Completa.auto_post.FACEBOOK_PAGE_TOKEN', 'mock_token_12345'), \
                  patch('Automatizare_Completa.auto_post.FACEBOOK_PAGE_ID', 'mock_page_67890'), \
                  patch('Automatizare_Completa.auto_post.FACEBOOK_APP_ID', 'mock_app_11111'), \
-                 patch('Automatizare_Completa.auto_post.requests.post') as mock_requests_post:
-                
+                 patch('Automatizare_Completa.auto_post.MultipartEncoder', None), \
+                 patch('Automatizare_Completa.auto_post.requests.Session.post') as mock_requests_post:
+
                 # Setup mock Facebook response
                 mock_response = MagicMock()
                 mock_response.status_code = 200
                 mock_response.json.return_value = {'id': '12345_67890'}
                 mock_requests_post.return_value = mock_response
-                
+
                 # Initialize and post
                 poster = FacebookAutoPost()
                 
                 with patch.object(Path, 'exists', return_value=True), \
                      patch.object(Path, 'is_file', return_value=True), \
                      patch.object(Path, 'suffix', '.png'), \
-                     patch('builtins.open', mock_open(read_data=b"fake image data")):
+                     patch('builtins.open', mock_open(read_data=b"\x89PNG\r\n\x1a\nfake image data")):
                     
                     result = poster.post_image("Test message", test_image)
                     
@@ -144,7 +145,7 @@ class TestEndToEndWorkflow:
         """Test that workflow properly tracks posted assets."""
         
         test_image = temp_dir / "Assets" / "Images" / "test_image.png"
-        test_image.write_bytes(b"fake image data")
+        test_image.write_bytes(b"\x89PNG\r\n\x1a\nfake image data")
         
         asset_tracking_file = temp_dir / "Config" / "asset_tracking.json"
         
@@ -171,7 +172,7 @@ class TestEndToEndWorkflow:
         """Test error handling in the workflow."""
         
         test_image = temp_dir / "Assets" / "Images" / "test_image.png"
-        test_image.write_bytes(b"fake image data")
+        test_image.write_bytes(b"\x89PNG\r\n\x1a\nfake image data")
         
         with patch.dict('os.environ', mock_env_vars, clear=True):
             from Automatizare_Completa.auto_post import FacebookAutoPost
@@ -179,7 +180,7 @@ class TestEndToEndWorkflow:
             with patch('Automatizare_Completa.auto_post.FACEBOOK_PAGE_TOKEN', 'mock_token_12345'), \
                  patch('Automatizare_Completa.auto_post.FACEBOOK_PAGE_ID', 'mock_page_67890'), \
                  patch('Automatizare_Completa.auto_post.FACEBOOK_APP_ID', 'mock_app_11111'), \
-                 patch('Automatizare_Completa.auto_post.requests.post') as mock_requests_post:
+                 patch('Automatizare_Completa.auto_post.requests.Session.post') as mock_requests_post:
                 
                 # Setup Facebook API error response
                 mock_response = MagicMock()
@@ -193,7 +194,7 @@ class TestEndToEndWorkflow:
                 with patch.object(Path, 'exists', return_value=True), \
                      patch.object(Path, 'is_file', return_value=True), \
                      patch.object(Path, 'suffix', '.png'), \
-                     patch('builtins.open', mock_open(read_data=b"fake image data")):
+                     patch('builtins.open', mock_open(read_data=b"\x89PNG\r\n\x1a\nfake image data")):
                     
                     result = poster.post_image("Test message", test_image)
                     
@@ -253,7 +254,7 @@ class TestEndToEndWorkflow:
             with patch('Automatizare_Completa.auto_post.FACEBOOK_PAGE_TOKEN', 'mock_token_12345'), \
                  patch('Automatizare_Completa.auto_post.FACEBOOK_PAGE_ID', 'mock_page_67890'), \
                  patch('Automatizare_Completa.auto_post.FACEBOOK_APP_ID', 'mock_app_11111'), \
-                 patch('Automatizare_Completa.auto_post.requests.post') as mock_requests_post:
+                 patch('Automatizare_Completa.auto_post.requests.Session.post') as mock_requests_post:
                 
                 mock_response = MagicMock()
                 mock_response.status_code = 200
@@ -5,7 +5,7 @@ Tests the HealthCheck class functionality with mocking.
 """
 
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 import sys
 import pathlib
 import json
@@ -16,7 +16,7 @@ from datetime import datetime
 # Add the project root to the path
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
 
-from Automatizare_Completa.health_check import HealthCheck
+from Automatizare_Completa.health_check import HealthCheck, CheckResult
 
 
 class TestHealthCheck(unittest.TestCase):
@@ -64,11 +64,11 @@ class TestHealthCheck(unittest.TestCase):
         
         result = self.health_check.check_python_version()
         
-        self.assertEqual(result['status'], 'Pass')
-        self.assertEqual(result['score'], 1.0)
-        self.assertEqual(result['details']['major'], 3)
-        self.assertEqual(result['details']['minor'], 9)
-        self.assertIn('Python 3.9.0 is compatible', result['message'])
+        self.assertEqual(result.status, 'Pass')
+        self.assertEqual(result.score, 1.0)
+        self.assertEqual(result.details['major'], 3)
+        self.assertEqual(result.details['minor'], 9)
+        self.assertIn('Python 3.9.0 is compatible', result.message)
     
     @patch('sys.version_info')
     def test_check_python_version_fail(self, mock_version_info):
@@ -79,48 +79,56 @@ class TestHealthCheck(unittest.TestCase):
         
         result = self.health_check.check_python_version()
         
-        self.assertEqual(result['status'], 'Fail')
-        self.assertEqual(result['score'], 0.0)
-        self.assertIn('Python 3.7.0 is too old', result['message'])
-    
-    @patch('subprocess.run')
-    def test_check_git_repository_pass(self, mock_run):
+        self.assertEqual(result.status, 'Fail')
+        self.assertEqual(result.score, 0.0)
+        self.assertIn('Python 3.7.0 is too old', result.message)
+
+    @patch('sys.version_info')
+    def test_check_python_version_fail_below_floor(self, mock_version_info):
+        """Test that Python 3.8 fails the 3.9 floor (asyncio.to_thread)."""
+        mock_version_info.major = 3
+        mock_version_info.minor = 8
+        mock_version_info.micro = 10
+
+        result = self.health_check.check_python_version()
+
+        self.assertEqual(result.status, 'Fail')
+        self.assertIn('requires 3.9+', result.message)
+
+    @patch('asyncio.create_subprocess_exec', new_callable=AsyncMock)
+    def test_check_git_repository_pass(self, mock_exec):
         """Test Git repository check with valid repository."""
-        # Mock git status command
-        mock_status = Mock()
-        mock_status.returncode = 0
-        mock_status.stdout = ""
-        
-        # Mock git branch command
-        mock_branch = Mock()
-        mock_branch.returncode = 0
-        mock_branch.stdout = "master"
-        
-        # Mock git log command
-        mock_log = Mock()
-        mock_log.returncode = 0
-        mock_log.stdout = "abc123 Test commit"
-        
-        mock_run.side_effect = [mock_status, mock_branch, mock_log]
-        
-        # Create .git directory
+        def fake_process(stdout):
+            process = MagicMock()
+            process.returncode = 0
+            process.communicate = AsyncMock(return_value=(stdout, b""))
+            return process
+
+        # The gather runs status and log in argument order
+        mock_exec.side_effect = [
+            fake_process(b""),
+            fake_process(b"abc123 Test commit\n")
+        ]
+
+        # Create .git directory; the branch is read from HEAD directly
         (self.project_root / ".git").mkdir()
+        (self.project_root / ".git" / "HEAD").write_text("ref: refs/heads/master\n")
         
         result = self.health_check.check_git_repository()
         
-        self.assertEqual(result['status'], 'Pass')
-        self.assertEqual(result['score'], 1.0)
-        self.assertTrue(result['details']['is_git_repo'])
-        self.assertEqual(result['details']['current_branch'], 'master')
-        self.assertEqual(result['details']['last_commit'], 'abc123 Test commit')
+        self.assertEqual(result.status, 'Pass')
+        self.assertEqual(result.score, 1.0)
+        self.assertTrue(result.details['is_git_repo'])
+        self.assertEqual(result.details['current_branch'], 'master')
+        self.assertEqual(result.details['last_commit'], 'abc123 Test commit')
     
     def test_check_git_repository_no_git(self):
         """Test Git repository check without .git directory."""
         result = self.health_check.check_git_repository()
         
-        self.assertEqual(result['status'], 'Fail')
-        self.assertEqual(result['score'], 0.0)
-        self.assertIn('Not a Git repository', result['message'])
+        self.assertEqual(result.status, 'Fail')
+        self.assertEqual(result.score, 0.0)
+        self.assertIn('Not a Git repository', result.message)
     
     def test_check_required_files_pass(self):
         """Test required files check with all files present."""
@@ -131,120 +139,124 @@ class TestHealthCheck(unittest.TestCase):
         
         result = self.health_check.check_required_files()
         
-        self.assertEqual(result['status'], 'Pass')
-        self.assertEqual(result['score'], 1.0)
-        self.assertEqual(len(result['details']['missing_files']), 0)
-        self.assertEqual(len(result['details']['missing_dirs']), 0)
+        self.assertEqual(result.status, 'Pass')
+        self.assertEqual(result.score, 1.0)
+        self.assertEqual(len(result.details['missing_files']), 0)
+        self.assertEqual(len(result.details['missing_dirs']), 0)
     
     def test_check_required_files_partial(self):
         """Test required files check with some files missing."""
         result = self.health_check.check_required_files()
         
-        self.assertEqual(result['status'], 'Warning')
-        self.assertGreater(result['score'], 0.5)
-        self.assertGreater(len(result['details']['missing_files']), 0)
+        self.assertEqual(result.status, 'Warning')
+        self.assertGreater(result.score, 0.5)
+        self.assertGreater(len(result.details['missing_files']), 0)
     
-    @patch('builtins.__import__')
-    def test_check_dependencies_pass(self, mock_import):
+    @patch('importlib.metadata.distributions')
+    def test_check_dependencies_pass(self, mock_distributions):
         """Test dependencies check with all packages available."""
-        mock_import.return_value = Mock()
-        
+        mock_distributions.return_value = [
+            Mock(metadata={'Name': 'requests'}),
+            Mock(metadata={'Name': 'openai'})
+        ]
+
         result = self.health_check.check_dependencies()
-        
-        self.assertEqual(result['status'], 'Pass')
-        self.assertEqual(result['score'], 1.0)
-        self.assertEqual(len(result['details']['missing_packages']), 0)
-    
-    @patch('builtins.__import__')
-    def test_check_dependencies_fail(self, mock_import):
+
+        self.assertEqual(result.status, 'Pass')
+        self.assertEqual(result.score, 1.0)
+        self.assertEqual(len(result.details['missing_packages']), 0)
+
+    @patch('importlib.util.find_spec')
+    @patch('importlib.metadata.distributions')
+    def test_check_dependencies_fail(self, mock_distributions, mock_find_spec):
         """Test dependencies check with missing packages."""
-        mock_import.side_effect = ImportError("No module named 'requests'")
-        
+        mock_distributions.return_value = []
+        mock_find_spec.return_value = None
+
         result = self.health_check.check_dependencies()
-        
-        self.assertEqual(result['status'], 'Fail')
-        self.assertEqual(result['score'], 0.0)
-        self.assertGreater(len(result['details']['missing_packages']), 0)
+
+        self.assertEqual(result.status, 'Fail')
+        self.assertEqual(result.score, 0.0)
+        self.assertGreater(len(result.details['missing_packages']), 0)
     
+    @patch('socket.create_connection')
     @patch('subprocess.run')
-    def test_check_github_connectivity_pass(self, mock_run):
+    def test_check_github_connectivity_pass(self, mock_run, mock_connect):
         """Test GitHub connectivity check with working connection."""
         # Mock git remote command
         mock_remote = Mock()
         mock_remote.returncode = 0
-        mock_remote.stdout = "origin  https://github.com/user/repo.git (fetch)\norigin  https://github.com/user/repo.git (push)"
-        
-        # Mock git fetch command
-        mock_fetch = Mock()
-        mock_fetch.returncode = 0
-        
-        mock_run.side_effect = [mock_remote, mock_fetch]
-        
+        mock_remote.stdout = b"origin  https://github.com/user/repo.git (fetch)\norigin  https://github.com/user/repo.git (push)"
+
+        mock_run.return_value = mock_remote
+
         result = self.health_check.check_github_connectivity()
+
+        mock_connect.assert_called_once_with(('github.com', 443), timeout=3)
         
-        self.assertEqual(result['status'], 'Pass')
-        self.assertEqual(result['score'], 1.0)
-        self.assertTrue(result['details']['has_github_remote'])
+        self.assertEqual(result.status, 'Pass')
+        self.assertEqual(result.score, 1.0)
+        self.assertTrue(result.details['has_github_remote'])
     
     @patch('subprocess.run')
     def test_check_github_connectivity_no_remote(self, mock_run):
         """Test GitHub connectivity check with no GitHub remote."""
         mock_remote = Mock()
         mock_remote.returncode = 0
-        mock_remote.stdout = "origin  https://gitlab.com/user/repo.git (fetch)"
+        mock_remote.stdout = b"origin  https://gitlab.com/user/repo.git (fetch)"
         
         mock_run.return_value = mock_remote
         
         result = self.health_check.check_github_connectivity()
         
-        self.assertEqual(result['status'], 'Warning')
-        self.assertEqual(result['score'], 0.3)
-        self.assertFalse(result['details']['has_github_remote'])
+        self.assertEqual(result.status, 'Warning')
+        self.assertEqual(result.score, 0.3)
+        self.assertFalse(result.details['has_github_remote'])
     
-    @patch('shutil.disk_usage')
-    def test_check_disk_space_pass(self, mock_disk_usage):
+    @patch('os.statvfs')
+    def test_check_disk_space_pass(self, mock_statvfs):
         """Test disk space check with sufficient space."""
         # Mock disk usage: 100GB total, 30GB free (30% free)
-        mock_disk_usage.return_value = Mock(
-            total=100 * 1024**3,  # 100GB
-            free=30 * 1024**3,    # 30GB
-            used=70 * 1024**3     # 70GB
+        mock_statvfs.return_value = Mock(
+            f_frsize=1024**3,
+            f_blocks=100,  # 100GB
+            f_bavail=30    # 30GB free
         )
-        
+
         result = self.health_check.check_disk_space()
-        
-        self.assertEqual(result['status'], 'Pass')
-        self.assertEqual(result['score'], 1.0)
-        self.assertEqual(result['details']['free_percentage'], 30.0)
-        self.assertIn('Disk space healthy', result['message'])
-    
-    @patch('shutil.disk_usage')
-    def test_check_disk_space_warning(self, mock_disk_usage):
+
+        self.assertEqual(result.status, 'Pass')
+        self.assertEqual(result.score, 1.0)
+        self.assertEqual(result.details['free_percentage'], 30)
+        self.assertIn('Disk space healthy', result.message)
+
+    @patch('os.statvfs')
+    def test_check_disk_space_warning(self, mock_statvfs):
         """Test disk space check with low space."""
         # Mock disk usage: 100GB total, 5GB free (5% free)
-        mock_disk_usage.return_value = Mock(
-            total=100 * 1024**3,  # 100GB
-            free=5 * 1024**3,     # 5GB
-            used=95 * 1024**3     # 95GB
+        mock_statvfs.return_value = Mock(
+            f_frsize=1024**3,
+            f_blocks=100,  # 100GB
+            f_bavail=5     # 5GB free
         )
-        
+
         result = self.health_check.check_disk_space()
-        
-        self.assertEqual(result['status'], 'Fail')
-        self.assertEqual(result['score'], 0.0)
-        self.assertEqual(result['details']['free_percentage'], 5.0)
-        self.assertIn('Disk space critical', result['message'])
+
+        self.assertEqual(result.status, 'Fail')
+        self.assertEqual(result.score, 0.0)
+        self.assertEqual(result.details['free_percentage'], 5)
+        self.assertIn('Disk space critical', result.message)
     
     def test_calculate_overall_health_healthy(self):
         """Test overall health calculation with healthy results."""
         # Mock results with high scores
         self.health_check.results = {
-            'Python Version': {'score': 1.0, 'status': 'Pass'},
-            'Git Repository': {'score': 1.0, 'status': 'Pass'},
-            'Required Files': {'score': 1.0, 'status': 'Pass'},
-            'Dependencies': {'score': 1.0, 'status': 'Pass'},
-            'GitHub Connectivity': {'score': 1.0, 'status': 'Pass'},
-            'Disk Space': {'score': 1.0, 'status': 'Pass'}
+            'Python Version': CheckResult(check='Python Version', score=1.0, status='Pass'),
+            'Git Repository': CheckResult(check='Git Repository', score=1.0, status='Pass'),
+            'Required Files': CheckResult(check='Required Files', score=1.0, status='Pass'),
+            'Dependencies': CheckResult(check='Dependencies', score=1.0, status='Pass'),
+            'GitHub Connectivity': CheckResult(check='GitHub Connectivity', score=1.0, status='Pass'),
+            'Disk Space': CheckResult(check='Disk Space', score=1.0, status='Pass')
         }
         
         health_status, health_score = self.health_check.calculate_overall_health()
@@ -256,12 +268,12 @@ class TestHealthCheck(unittest.TestCase):
         """Test overall health calculation with degraded results."""
         # Mock results with mixed scores
         self.health_check.results = {
-            'Python Version': {'score': 1.0, 'status': 'Pass'},
-            'Git Repository': {'score': 0.8, 'status': 'Warning'},
-            'Required Files': {'score': 0.7, 'status': 'Warning'},
-            'Dependencies': {'score': 1.0, 'status': 'Pass'},
-            'GitHub Connectivity': {'score': 0.5, 'status': 'Warning'},
-            'Disk Space': {'score': 1.0, 'status': 'Pass'}
+            'Python Version': CheckResult(check='Python Version', score=1.0, status='Pass'),
+            'Git Repository': CheckResult(check='Git Repository', score=0.8, status='Warning'),
+            'Required Files': CheckResult(check='Required Files', score=0.7, status='Warning'),
+            'Dependencies': CheckResult(check='Dependencies', score=1.0, status='Pass'),
+            'GitHub Connectivity': CheckResult(check='GitHub Connectivity', score=0.5, status='Warning'),
+            'Disk Space': CheckResult(check='Disk Space', score=1.0, status='Pass')
         }
         
         health_status, health_score = self.health_check.calculate_overall_health()
@@ -274,12 +286,12 @@ class TestHealthCheck(unittest.TestCase):
         """Test overall health calculation with critical results."""
         # Mock results with low scores
         self.health_check.results = {
-            'Python Version': {'score': 0.0, 'status': 'Fail'},
-            'Git Repository': {'score': 0.0, 'status': 'Fail'},
-            'Required Files': {'score': 0.3, 'status': 'Fail'},
-            'Dependencies': {'score': 0.0, 'status': 'Fail'},
-            'GitHub Connectivity': {'score': 0.0, 'status': 'Fail'},
-            'Disk Space': {'score': 0.0, 'status': 'Fail'}
+            'Python Version': CheckResult(check='Python Version', score=0.0, status='Fail'),
+            'Git Repository': CheckResult(check='Git Repository', score=0.0, status='Fail'),
+            'Required Files': CheckResult(check='Required Files', score=0.3, status='Fail'),
+            'Dependencies': CheckResult(check='Dependencies', score=0.0, status='Fail'),
+            'GitHub Connectivity': CheckResult(check='GitHub Connectivity', score=0.0, status='Fail'),
+            'Disk Space': CheckResult(check='Disk Space', score=0.0, status='Fail')
         }
         
         health_status, health_score = self.health_check.calculate_overall_health()
@@ -291,7 +303,7 @@ class TestHealthCheck(unittest.TestCase):
         """Test saving health check report."""
         # Set up mock results
         self.health_check.results = {
-            'Python Version': {'score': 1.0, 'status': 'Pass', 'message': 'OK'}
+            'Python Version': CheckResult(check='Python Version', score=1.0, status='Pass', message='OK')
         }
         self.health_check.overall_health = 'Healthy'
         self.health_check.health_score = 1.0
@@ -317,8 +329,8 @@ class TestHealthCheck(unittest.TestCase):
         """Test printing health check summary."""
         # Set up mock results
         self.health_check.results = {
-            'Python Version': {'score': 1.0, 'status': 'Pass', 'message': 'OK'},
-            'Git Repository': {'score': 0.8, 'status': 'Warning', 'message': 'Warning'}
+            'Python Version': CheckResult(check='Python Version', score=1.0, status='Pass', message='OK'),
+            'Git Repository': CheckResult(check='Git Repository', score=0.8, status='Warning', message='Warning')
         }
         self.health_check.overall_health = 'Degraded'
         self.health_check.health_score = 0.9
@@ -349,12 +361,12 @@ class TestHealthCheck(unittest.TestCase):
                            mock_deps, mock_files, mock_git, mock_python):
         """Test running all health checks."""
         # Mock check results
-        mock_python.return_value = {'check': 'Python Version', 'status': 'Pass', 'score': 1.0}
-        mock_git.return_value = {'check': 'Git Repository', 'status': 'Pass', 'score': 1.0}
-        mock_files.return_value = {'check': 'Required Files', 'status': 'Pass', 'score': 1.0}
-        mock_deps.return_value = {'check': 'Dependencies', 'status': 'Pass', 'score': 1.0}
-        mock_github.return_value = {'check': 'GitHub Connectivity', 'status': 'Pass', 'score': 1.0}
-        mock_disk.return_value = {'check': 'Disk Space', 'status': 'Pass', 'score': 1.0}
+        mock_python.return_value = CheckResult(check='Python Version', status='Pass', score=1.0)
+        mock_git.return_value = CheckResult(check='Git Repository', status='Pass', score=1.0)
+        mock_files.return_value = CheckResult(check='Required Files', status='Pass', score=1.0)
+        mock_deps.return_value = CheckResult(check='Dependencies', status='Pass', score=1.0)
+        mock_github.return_value = CheckResult(check='GitHub Connectivity', status='Pass', score=1.0)
+        mock_disk.return_value = CheckResult(check='Disk Space', status='Pass', score=1.0)
         
         mock_save.return_value = pathlib.Path('/tmp/test_report.json')
         
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the RateLimiter module
+"""
+
+import pytest
+from unittest.mock import patch
+from Automatizare_Completa.rate_limiter import RateLimiter, TokenBucket
+
+class TestRateLimiter:
+    """Test cases for RateLimiter class."""
+
+    def test_admission_under_limit_does_not_sleep(self):
+        """Requests under the per-minute limit are admitted immediately."""
+        limiter = RateLimiter(max_per_minute=5)
+
+        with patch('Automatizare_Completa.rate_limiter.time.sleep') as mock_sleep:
+            for _ in range(5):
+                limiter.wait_if_throttled()
+
+            mock_sleep.assert_not_called()
+
+    def test_admission_over_limit_waits(self):
+        """The request over the window limit waits for a slot."""
+        limiter = RateLimiter(max_per_minute=2)
+
+        # Monotonic clock advances past the window after the first sleep
+        times = iter([0.0, 0.1, 0.2, 61.0])
+        with patch('Automatizare_Completa.rate_limiter.time.monotonic', side_effect=times), \
+             patch('Automatizare_Completa.rate_limiter.time.sleep') as mock_sleep:
+            limiter.wait_if_throttled()
+            limiter.wait_if_throttled()
+            limiter.wait_if_throttled()
+
+            mock_sleep.assert_called_once()
+
+    def test_failure_halves_concurrency(self):
+        """A 429/5xx failure halves the concurrency hint (floor 1)."""
+        limiter = RateLimiter(max_per_minute=60, max_concurrency=8)
+
+        assert limiter.concurrency == 8
+        limiter.record_failure()
+        assert limiter.concurrency == 4
+        for _ in range(10):
+            limiter.record_failure()
+        assert limiter.concurrency == 1
+
+    def test_success_run_restores_concurrency(self):
+        """A run of successes additively restores concurrency up to the cap."""
+        limiter = RateLimiter(max_per_minute=60, max_concurrency=8, success_threshold=2)
+
+        limiter.record_failure()  # 8 -> 4
+        for _ in range(4):
+            limiter.record_success()  # two full runs: 4 -> 4.5 -> 5
+
+        assert limiter.concurrency == 5
+
+    def test_failure_resets_success_run(self):
+        """A failure resets the consecutive-success counter."""
+        limiter = RateLimiter(max_per_minute=60, max_concurrency=8, success_threshold=3)
+
+        limiter.record_failure()  # 8 -> 4
+        limiter.record_success()
+        limiter.record_success()
+        limiter.record_failure()  # 4 -> 2, resets the run
+        limiter.record_success()
+        limiter.record_success()
+
+        assert limiter.concurrency == 2
+
+class TestTokenBucket:
+    """Test cases for TokenBucket class."""
+
+    def test_acquire_with_tokens_does_not_sleep(self):
+        """Acquires against a full bucket are admitted immediately."""
+        bucket = TokenBucket(capacity=3, refill_rate=1.0)
+
+        with patch('Automatizare_Completa.rate_limiter.time.sleep') as mock_sleep:
+            for _ in range(3):
+                bucket.acquire()
+
+            mock_sleep.assert_not_called()
+        assert bucket.tokens < 1.0
+
+    def test_acquire_on_empty_bucket_waits_for_refill(self):
+        """An acquire against an empty bucket sleeps until tokens refill."""
+        bucket = TokenBucket(capacity=1, refill_rate=2.0)
+        bucket.acquire()
+
+        # Clock starts with the bucket empty, then jumps past the refill
+        times = iter([0.0, 1.0])
+        with patch('Automatizare_Completa.rate_limiter.time.monotonic', side_effect=times), \
+             patch('Automatizare_Completa.rate_limiter.time.sleep') as mock_sleep:
+            bucket._last_refill = 0.0
+            bucket.acquire()
+
+            mock_sleep.assert_called_once()
+
+    def test_penalize_forces_full_refill_wait(self):
+        """A 429 penalty drives the balance negative."""
+        bucket = TokenBucket(capacity=5, refill_rate=1.0)
+
+        bucket.penalize()
+
+        assert bucket.tokens < 0.0
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
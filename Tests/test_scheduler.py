@@ -102,33 +102,36 @@ class TestTaskScheduler:
             saved_data = json.load(f)
         assert saved_data == test_data
     
-    @patch('Automatizare_Completa.scheduler.subprocess.run')
-    def test_run_task_calls_subprocess(self, mock_run, scheduler):
+    @patch('Automatizare_Completa.scheduler.subprocess.Popen')
+    def test_run_task_calls_subprocess(self, mock_popen, scheduler):
         """Test that run_task calls subprocess with correct arguments."""
         # Arrange
-        mock_run.return_value = MagicMock(returncode=0, stdout="Success", stderr="")
-        
+        mock_proc = MagicMock()
+        mock_proc.stdout = ["Success\n"]
+        mock_proc.wait.return_value = 0
+        mock_popen.return_value = mock_proc
+
         # Create a test script
         test_script = scheduler.automatizare_dir / "test_script.py"
         test_script.parent.mkdir(parents=True, exist_ok=True)
         test_script.write_text("print('test')")
-        
+
         job = {
             "task": "test_script.py",
             "description": "Test task"
         }
-        
+
         # Act
         scheduler.run_task(job)
-        
+
         # Assert
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args
+        mock_popen.assert_called_once()
+        call_args = mock_popen.call_args
         assert call_args[0][0] == [sys.executable, str(test_script)]
         assert call_args[1]['cwd'] == scheduler.project_root
-        assert call_args[1]['timeout'] == 300
-    
-    @patch('Automatizare_Completa.scheduler.subprocess.run')
+        mock_proc.wait.assert_called_once_with(timeout=300)
+
+    @patch('Automatizare_Completa.scheduler.subprocess.Popen')
     def test_run_task_script_not_found(self, mock_run, scheduler):
         """Test run_task when script doesn't exist."""
         # Arrange
@@ -143,11 +146,14 @@ class TestTaskScheduler:
         # Assert
         mock_run.assert_not_called()
     
-    @patch('Automatizare_Completa.scheduler.subprocess.run')
-    def test_run_task_success(self, mock_run, scheduler):
+    @patch('Automatizare_Completa.scheduler.subprocess.Popen')
+    def test_run_task_success(self, mock_popen, scheduler):
         """Test run_task with successful execution."""
         # Arrange
-        mock_run.return_value = MagicMock(returncode=0, stdout="Success", stderr="")
+        mock_proc = MagicMock()
+        mock_proc.stdout = ["Success\n"]
+        mock_proc.wait.return_value = 0
+        mock_popen.return_value = mock_proc
         
         test_script = scheduler.automatizare_dir / "test_script.py"
         test_script.parent.mkdir(parents=True, exist_ok=True)
@@ -165,11 +171,14 @@ class TestTaskScheduler:
         # Assert
         assert job['last_run'] is not None
     
-    @patch('Automatizare_Completa.scheduler.subprocess.run')
-    def test_run_task_failure(self, mock_run, scheduler):
+    @patch('Automatizare_Completa.scheduler.subprocess.Popen')
+    def test_run_task_failure(self, mock_popen, scheduler):
         """Test run_task with failed execution."""
         # Arrange
-        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="Error occurred")
+        mock_proc = MagicMock()
+        mock_proc.stdout = ["Error occurred\n"]
+        mock_proc.wait.return_value = 1
+        mock_popen.return_value = mock_proc
         
         test_script = scheduler.automatizare_dir / "test_script.py"
         test_script.parent.mkdir(parents=True, exist_ok=True)
@@ -187,12 +196,15 @@ class TestTaskScheduler:
         # Assert
         assert job['last_run'] is not None
     
-    @patch('Automatizare_Completa.scheduler.subprocess.run')
-    def test_run_task_timeout(self, mock_run, scheduler):
+    @patch('Automatizare_Completa.scheduler.subprocess.Popen')
+    def test_run_task_timeout(self, mock_popen, scheduler):
         """Test run_task with timeout."""
         # Arrange
         from subprocess import TimeoutExpired
-        mock_run.side_effect = TimeoutExpired("python", 300)
+        mock_proc = MagicMock()
+        mock_proc.stdout = []
+        mock_proc.wait.side_effect = TimeoutExpired("python", 300)
+        mock_popen.return_value = mock_proc
         
         test_script = scheduler.automatizare_dir / "test_script.py"
         test_script.parent.mkdir(parents=True, exist_ok=True)
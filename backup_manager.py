@@ -15,8 +15,10 @@ from pathlib import Path
 from typing import List, Dict, Any
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables, unless a parent process already passed
+# the resolved environment down
+if not os.environ.get("SB_ENV_LOADED"):
+    load_dotenv()
 
 # Setup logging
 logging.basicConfig(